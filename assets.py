@@ -0,0 +1,78 @@
+"""
+one place that loads the sounds, fonts and images of the game,
+every asset is loaded the first time it is asked for and after that
+the same object is shared by everything that uses it
+"""
+import pygame
+
+from collections import OrderedDict
+
+_sounds = {}
+_fonts = {}
+_images = {}
+
+# rendered text, the least recently used surfaces are thrown away once there are more than max_texts
+_texts = OrderedDict()
+max_texts = 256
+
+
+class SilentSound:
+    # what sound returns when there is no mixer, the game logic can play it without checking for one
+    def play(self, *args, **kwargs) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def set_volume(self, volume: float) -> None:
+        pass
+
+
+def sound(path: str, volume: float | None = None) -> pygame.mixer.Sound | SilentSound:
+    if not pygame.mixer.get_init():
+        return SilentSound()
+    if path not in _sounds:
+        _sounds[path] = pygame.mixer.Sound(path)
+        if volume is not None:
+            _sounds[path].set_volume(volume)
+    return _sounds[path]
+
+
+def font(path: str, size: int) -> pygame.font.Font:
+    key = (path, size)
+    if key not in _fonts:
+        _fonts[key] = pygame.font.Font(path, size)
+    return _fonts[key]
+
+
+def image(path: str, colorkey: tuple | None = None) -> pygame.Surface:
+    key = (path, colorkey)
+    if key not in _images:
+        surf = pygame.image.load(path).convert()
+        if colorkey is not None:
+            surf.set_colorkey(colorkey)
+        _images[key] = surf
+    return _images[key]
+
+
+def text(font: pygame.font.Font, string: str, color: tuple, antialias: bool = True) -> pygame.Surface:
+    """
+    the same as font.render(string, antialias, color) but the surface is only rendered
+    the first time, so text that does not change is not rendered again every frame
+    """
+    key = (font, string, tuple(color), antialias)
+    surf = _texts.get(key)
+    if surf is None:
+        surf = _texts[key] = font.render(string, antialias, color)
+        if len(_texts) > max_texts:
+            _texts.popitem(last=False)
+    else:
+        _texts.move_to_end(key)
+    return surf
+
+
+def clear() -> None:
+    _sounds.clear()
+    _fonts.clear()
+    _images.clear()
+    _texts.clear()
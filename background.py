@@ -0,0 +1,33 @@
+import pygame
+
+
+class StripeBackground:
+    """
+    the scrolling orange stripes behind the game, the stripes are drawn once into a surface
+    that is one stripe spacing taller than the screen, because the pattern repeats every spacing
+    pixels scrolling it is just blitting that surface at an offset between -spacing and 0
+    """
+    def __init__(self, ds: tuple, color: tuple = (230, 122, 0), spacing: int = 100, width: int = 40, speed: float = 2):
+        self.color = color
+        self.spacing = spacing
+        self.width = width
+        self.speed = speed
+
+        self.scroll = 0.0
+        self.surf = None
+        self.build(ds)
+
+    def build(self, ds: tuple) -> None:
+        # draws the stripes for a display of size ds, call it again when the resolution changes
+        self.scroll = 0.0
+        self.surf = pygame.Surface((ds[0], ds[1] + self.spacing))
+        self.surf.set_colorkey((0, 0, 0))
+
+        for y in range(-self.spacing, ds[1] + self.spacing * 2 + 1, self.spacing):
+            pygame.draw.line(self.surf, self.color, (-10, y), (ds[0] + 10, y + self.spacing), self.width)
+
+    def update(self, dt: float) -> None:
+        self.scroll = (self.scroll + self.speed * dt) % self.spacing
+
+    def draw(self, surf: pygame.Surface) -> None:
+        surf.blit(self.surf, (0, self.scroll - self.spacing))
@@ -0,0 +1,160 @@
+"""
+plays a lot of seeded headless games in parallel on every core and sums up the score, survival time
+and peak particle count of every configuration, to tune the spawning and the blob types without playing:
+    python batch.py --games 1000
+    python batch.py configs.json --games 200 --input sweep --output results.json
+
+configs.json is a list of configurations, every key is optional and missing ones keep the game's values,
+spawn_ramp is [start, end, duration] and goes from start to end seconds between spawns over duration seconds:
+    [{"name": "slow spawns", "spawn_time": 3,
+      "weights": {"Blob": 4, "SpeedBlob": 8, "HeavyBlob": 2, "RandomBlob": 3},
+      "blobs": {"SpeedBlob": {"growth_speed": 0.2, "not_feed_time": 8, "max_radius": 60}}}]
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keeps the json on stdout clean
+
+import pygame
+import numpy as np
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import entities
+from simulation import Simulation
+from spawner import BlobSpawner, DEFAULT_FACTORIES, constant, linear_ramp
+from rng import RandomStreams
+from timestep import GameClock
+from headless import INPUT_SCRIPTS, DS
+
+DEFAULT_CONFIG = {"name": "default"}
+
+
+def tuned(blob_class: type, **overrides) -> type:
+    """
+    a subclass of blob_class that sets some of the values reset gives the blob to something else,
+    for example tuned(SpeedBlob, max_radius=60), it is its own class so the spawner pools it on its own
+    """
+    if not overrides:
+        return blob_class
+
+    def reset(self, ds):
+        blob_class.reset(self, ds)
+        for name, value in overrides.items():
+            setattr(self, name, value)
+
+    return type(blob_class.__name__, (blob_class,), {"reset": reset})
+
+
+def build_spawner(config: dict, rng: RandomStreams, clock: GameClock) -> BlobSpawner:
+    # the game's spawner with the values config changes
+    weights = {factory.__name__: weight for factory, weight in DEFAULT_FACTORIES}
+    weights.update(config.get("weights", {}))
+    blobs = config.get("blobs", {})
+    factories = [(tuned(getattr(entities, name), **blobs.get(name, {})), weight) for name, weight in weights.items() if weight > 0]
+    spawn_curve = None
+    if "spawn_ramp" in config:
+        spawn_curve = linear_ramp(*config["spawn_ramp"])
+    elif "spawn_time" in config:
+        spawn_curve = constant(config["spawn_time"])
+    return BlobSpawner(DS, factories, spawn_curve, rng=rng, clock=clock)
+
+
+def start_worker() -> None:
+    # runs once in every worker process, the assets are loaded relative to the repo
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    pygame.font.init()
+
+
+def play(config: dict, seed: int, max_ticks: int, input_name: str) -> dict:
+    """
+    plays one game until it is lost or max_ticks ticks passed, returns what happened in it
+    """
+    rng = RandomStreams(seed)
+    clock = GameClock()
+    simulation = Simulation(DS, build_spawner(config, rng, clock), rng=rng, clock=clock)
+    input_script = INPUT_SCRIPTS[input_name]
+
+    peak_particles = 0
+    peak_blobs = 0
+    start = time.perf_counter()
+    while simulation.ticks < max_ticks and not simulation.game_over:
+        mouse_press, mouse_position = input_script(simulation.ticks, simulation)
+        simulation.tick(1.0, mouse_press, mouse_position)
+        peak_particles = max(peak_particles, simulation.particle_count())
+        peak_blobs = max(peak_blobs, len(simulation.blobs))
+    seconds = time.perf_counter() - start
+
+    return {
+        "seed": seed,
+        "score": simulation.points,
+        "survival_ticks": simulation.ticks,
+        "lost": simulation.game_over,
+        "peak_particles": peak_particles,
+        "peak_blobs": peak_blobs,
+        "ticks_per_second": simulation.ticks / seconds if seconds else 0.0,
+    }
+
+
+def summarize(games: list) -> dict:
+    summary = {"games": len(games), "lost": sum(game["lost"] for game in games)}
+    for key in ("score", "survival_ticks", "peak_particles", "peak_blobs", "ticks_per_second"):
+        values = np.array([game[key] for game in games], dtype=float)
+        summary[key] = {
+            "mean": round(float(values.mean()), 2),
+            "p5": round(float(np.percentile(values, 5)), 2),
+            "p50": round(float(np.percentile(values, 50)), 2),
+            "p95": round(float(np.percentile(values, 95)), 2),
+            "max": round(float(values.max()), 2),
+        }
+    return summary
+
+
+def run(configs: list, games: int, max_ticks: int, input_name: str, workers: int | None = None) -> dict:
+    # every configuration plays the same seeds, so the difference between two of them is the configuration
+    jobs = [(config, seed) for config in configs for seed in range(games)]
+    with ProcessPoolExecutor(workers, initializer=start_worker) as executor:
+        results = list(executor.map(play, [c for c, s in jobs], [s for c, s in jobs], [max_ticks] * len(jobs),
+                                    [input_name] * len(jobs), chunksize=max(1, len(jobs) // ((workers or os.cpu_count() or 1) * 4))))
+
+    summaries = {}
+    for i, config in enumerate(configs):
+        summaries[config.get("name", f"config {i}")] = {
+            "config": config,
+            "summary": summarize(results[i * games:(i + 1) * games]),
+        }
+    return summaries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("configs", nargs="?", help="json file with a list of configurations, the game's values when not given")
+    parser.add_argument("--games", type=int, default=100, help="games played by every configuration")
+    parser.add_argument("--max-ticks", type=int, default=60 * 60 * 10, help="a game that is not lost after this many ticks ends")
+    parser.add_argument("--input", choices=INPUT_SCRIPTS, default="bot", help="what plays the games")
+    parser.add_argument("--workers", type=int, default=None, help="processes to use, every core when not given")
+    parser.add_argument("--output", help="the json file to write, it is printed when this is not given")
+    args = parser.parse_args()
+
+    if args.configs:
+        with open(args.configs) as file:
+            configs = json.load(file)
+    else:
+        configs = [DEFAULT_CONFIG]
+
+    results = run(configs, args.games, args.max_ticks, args.input, args.workers)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
+    sys.exit()
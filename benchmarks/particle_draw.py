@@ -0,0 +1,87 @@
+"""
+times ParticleSystem.draw with the blits render mode against the draw (one pygame.draw call per particle) mode
+on the particles the game draws, sized, colored and shrinking the way the game makes them,
+run it from the root of the repo with: python -m benchmarks.particle_draw
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import random as rnd
+import time
+
+from particles import ParticleSystem
+import sprites
+
+DS = (600, 600)
+FRAMES = 60
+
+
+def food(rand: rnd.Random, particles: ParticleSystem, amount: int) -> None:
+    # Feeder.update, a random color for every particle
+    for _ in range(amount):
+        particles.add([rand.uniform(0, DS[0]), rand.uniform(0, DS[1])], rand.randint(0, 180), rand.randint(1, 3) / 10,
+                      rand.randint(1, 2) * 5, (rand.randint(100, 170), rand.randint(100, 170), rand.randint(100, 170)), 0.01)
+
+
+def explosion(rand: rnd.Random, particles: ParticleSystem, amount: int) -> None:
+    # the two bursts of Blob.update, half white and half a random color close to the body color
+    for _ in range(amount // 2):
+        position = [rand.uniform(0, DS[0]), rand.uniform(0, DS[1])]
+        particles.add(position, rand.randint(0, 360), rand.randint(100, 2000) / 100, rand.randint(40, 60), (255, 255, 255), 0.5)
+        shade = (rand.randint(168, 208), rand.randint(168, 208), rand.randint(168, 208))
+        particles.add(position, rand.randint(0, 360), rand.randint(100, 1500) / 100, rand.randint(20, 40), shade, 0.1)
+
+
+def blob_body(rand: rnd.Random, particles: ParticleSystem, amount: int) -> None:
+    # the outer particles of a blob with a radius of 32, one color and a few sizes
+    for _ in range(amount):
+        particles.add([rand.uniform(0, DS[0]), rand.uniform(0, DS[1])], rand.randint(0, 360), rand.randint(1, 5) / 5,
+                      rand.randint(11, 16), (208, 208, 208), 0.0)
+
+
+KINDS = {"food": (food, (3, 3), 0.2), "explosion": (explosion, (3, 3), 0.2), "blob body": (blob_body, None, 0.0)}
+
+
+def make_particles(kind: str, render_mode: str, amount: int, seed: int = 0) -> ParticleSystem:
+    # the same particles for every render mode
+    add, shadow, gravity = KINDS[kind]
+    particles = ParticleSystem("circle", gravity, render_mode=render_mode, capacity=amount)
+    add(rnd.Random(seed), particles, amount)
+    return particles
+
+
+def time_draw(particles: ParticleSystem, shadow: tuple | None, frames: int = FRAMES) -> float:
+    """
+    milliseconds per frame, the particles move and shrink between the frames like in the game
+    and the sprite cache starts empty, so sprites that are never reused are paid for too
+    """
+    display = pygame.Surface(DS)
+    sprites.clear()
+    total = 0.0
+    for _ in range(frames):
+        particles.step(1.0)
+        display.fill((230, 229, 0))
+        start = time.perf_counter()
+        particles.draw(display, shadow=shadow)
+        total += time.perf_counter() - start
+    return total / frames * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    print(f"{'particles':<10} {'amount':>7} {'draw ms':>9} {'blits ms':>9} {'speedup':>8}")
+    for kind, (add, shadow, gravity) in KINDS.items():
+        for amount in (20, 200, 2000):
+            draw = time_draw(make_particles(kind, "draw", amount), shadow)
+            blits = time_draw(make_particles(kind, "blits", amount), shadow)
+            print(f"{kind:<10} {amount:>7} {draw:>9.3f} {blits:>9.3f} {draw / blits:>7.2f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+the benchmark suite for the particle and entity hot paths, every benchmark seeds random, empties the
+sprite and asset caches and uses a fixed dt so two runs of the same version do the same work no matter
+which benchmarks ran before it, the results are written as json
+so the runs of two versions can be diffed, run it from the root of the repo with:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --filter particles --repeat 3
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keeps the json on stdout clean
+
+import pygame
+import numpy as np
+
+import argparse
+import json
+import platform
+import random as rnd
+import statistics
+import sys
+import time
+
+from particles import ParticleSystem, SpatialHash
+from entities import Blob
+from rng import RandomStreams
+from screens import Screens
+import assets
+import sprites
+
+DS = 600, 600
+DT = 1.0
+SEED = 0
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    # registers a benchmark, it gets the repeat count and returns {case: timings}
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def measure(function, repeat: int, setup=None) -> dict:
+    """
+    runs function repeat times and returns its timings in milliseconds, setup runs before every
+    repeat without being timed and what it returns is passed to function, random is seeded and
+    the caches are emptied before every setup so every repeat does the same work from a cold cache
+    """
+    times = []
+    for _ in range(repeat):
+        rnd.seed(SEED)
+        sprites.clear()
+        assets.clear()
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        function(state)
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(times), 4),
+        "median_ms": round(statistics.median(times), 4),
+        "max_ms": round(max(times), 4),
+        "repeat": repeat,
+    }
+
+
+def particle_system(amount: int, dis_amount: float = 0.0) -> ParticleSystem:
+    particles = ParticleSystem("circle", 0.2, capacity=amount)
+    particles.add_many(
+        [[rnd.uniform(0, DS[0]), rnd.uniform(0, DS[1])] for _ in range(amount)],
+        [rnd.randint(0, 360) for _ in range(amount)],
+        [rnd.randint(1, 3) / 10 for _ in range(amount)],
+        [rnd.randint(1, 2) * 5 for _ in range(amount)],
+        [(rnd.randint(100, 170), rnd.randint(100, 170), rnd.randint(100, 170)) for _ in range(amount)],
+        dis_amount,
+    )
+    return particles
+
+
+@benchmark("particles")
+def particles_benchmark(repeat: int) -> dict:
+    results = {}
+    display = pygame.Surface(DS)
+    for amount in (1000, 10000, 100000):
+        def add(particles):
+            for _ in range(amount):
+                particles.add([300, 300], rnd.randint(0, 360), rnd.randint(1, 3) / 10, 10, (120, 120, 120), 0.01)
+        results[f"add/{amount}"] = measure(add, repeat, lambda: ParticleSystem("circle", 0.2))
+
+        def add_many(particles):
+            particles.add_many([300, 300], np.arange(amount) % 360, 0.2, 10, (120, 120, 120), 0.01)
+        results[f"add_many/{amount}"] = measure(add_many, repeat, lambda: ParticleSystem("circle", 0.2))
+
+        # 10 ticks of a system where nothing dies, so every tick moves the same amount of particles
+        def step(particles):
+            for _ in range(10):
+                particles.step(DT, bounds=pygame.Rect(0, 0, *DS))
+        results[f"step_10_ticks/{amount}"] = measure(step, repeat, lambda: particle_system(amount))
+
+        def use(particles):
+            particles.use(display, DT, shadow=(3, 3))
+        results[f"use/{amount}"] = measure(use, repeat, lambda: particle_system(amount))
+    return results
+
+
+@benchmark("blob_update")
+def blob_update_benchmark(repeat: int) -> dict:
+    # 60 ticks of one blob against food that is spread over the screen, the food grid is built every tick like in the game
+    results = {}
+    for amount in (100, 1000, 10000):
+        def setup():
+            blob = Blob(DS, RandomStreams(SEED))
+            blob.position = pygame.Vector2(DS[0] / 2, DS[1] / 2)
+            blob.max_radius = float("inf")  # so the blob keeps eating instead of exploding halfway
+            return blob, particle_system(amount), SpatialHash()
+
+        def update(state):
+            blob, food, food_grid = state
+            for _ in range(60):
+                food_grid.build(food.loc)
+                blob.update(DT, food_grid, False)
+        results[f"60_ticks/{amount}_food"] = measure(update, repeat, setup)
+    return results
+
+
+@benchmark("explosion")
+def explosion_benchmark(repeat: int) -> dict:
+    display = pygame.Surface(DS)
+
+    def setup():
+        blob = Blob(DS, RandomStreams(SEED))
+        blob.position = pygame.Vector2(DS[0] / 2, DS[1] / 2)
+        blob.radius = blob.max_radius  # the next update explodes it
+        return blob
+
+    def burst(blob):
+        blob.update(DT, None, True)
+
+    def aftermath(blob):
+        # the burst and every tick after it until the last particle is gone
+        blob.update(DT, None, True)
+        while len(blob.particles):
+            blob.update(DT, None, True)
+            blob.draw(display)
+
+    return {
+        "burst": measure(burst, repeat, setup),
+        "burst_until_gone": measure(aftermath, repeat, setup),
+    }
+
+
+@benchmark("gui")
+def gui_benchmark(repeat: int) -> dict:
+    # 60 frames of every screen drawn at the place it rests at in the game
+    display = pygame.Surface(DS)
+    center = (DS[0] / 2, DS[1] / 2)
+    screens = Screens(center, center, center)
+
+    results = {}
+    for name in ("menu", "tutorial", "game_over"):
+        screen = getattr(screens, name)
+
+        def frames(state):
+            for _ in range(60):
+                display.fill((230, 229, 0))
+                screen.draw(display)
+                screen.dirty_rect()
+        results[f"60_frames/{name}"] = measure(frames, repeat)
+    return results
+
+
+def run(names: list, repeat: int) -> dict:
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": SEED,
+            "dt": DT,
+            "repeat": repeat,
+            "caches": "cold",  # the sprite and asset caches are emptied before every repeat
+        },
+        "results": {name: BENCHMARKS[name](repeat) for name in names},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="the json file to write, it is printed when this is not given")
+    parser.add_argument("--filter", default="", help="only runs the benchmarks with this in their name")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    results = run(names, args.repeat)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
+    sys.exit()
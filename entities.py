@@ -1,66 +1,81 @@
 import pygame
-from xfps import ShapeParticles, surf_circle
 
-import random as rnd
-import time
+from particles import ParticleSystem
+import assets
+import sprites
+
+from rng import RandomStreams
+from timestep import GameClock
 
 
 class Feeder:
-    def __init__(self, ds: tuple):
-        self.ds = ds
+    def __init__(self, ds: tuple, rng: RandomStreams | None = None):
+        self.rng = rng or RandomStreams()
 
-        self.position = pygame.Vector2(ds[0] / 2, 60)
         self.radius = 25
-        self.direction = 0  # 0 = no direction, 1 = right direction, -1 = left direction
-        self.globe = surf_circle(self.radius, (0, 100, 200))
+        self.globe = sprites.surf_circle(self.radius, (0, 100, 200))
+
+        self.particles = ParticleSystem("circle", 0.2)  # the food
+
+        self.inner_particles = ParticleSystem("circle", 0.0)  # the particle inside the globe
 
-        self.particles = ShapeParticles("circle", 0.2)  # the food
+        self.reset(ds)
 
-        self.inner_particles = ShapeParticles("circle", 0.0)  # the particle inside the globe
+    def reset(self, ds: tuple):
+        # puts the feeder back to the start of a game while keeping the particle buffers
+        self.ds = ds
+
+        self.position = pygame.Vector2(ds[0] / 2, 60)
+        self.previous_position = pygame.Vector2(self.position)  # the position one tick ago, draw interpolates between the two
+        self.drawn_position = pygame.Vector2(self.position)
+        self.direction = 0  # 0 = no direction, 1 = right direction, -1 = left direction
 
+        self.particles.clear()
+        self.inner_particles.clear()
+        cosmetic = self.rng.cosmetic
         for i in range(20):
             self.inner_particles.add(
                 [self.position.x-5, self.position.y+self.radius],
-                rnd.randint(0, 360),
-                rnd.randint(1, 2)/2,
-                rnd.randint(5, 12),
-                (rnd.randint(100, 170), rnd.randint(100, 170), rnd.randint(100, 170)),
+                cosmetic.randint(0, 360),
+                cosmetic.randint(1, 2)/2,
+                cosmetic.randint(5, 12),
+                (cosmetic.randint(100, 170), cosmetic.randint(100, 170), cosmetic.randint(100, 170)),
                 0.0
             )
 
         self.inner_particles_collider = pygame.Rect(0, 0, 0, 0)  # initializing the collision box of the inner particles
 
-    def draw(self, display, dt):
-
+    def draw(self, display, alpha: float = 1.0):
         """
-        this function makes sure the inner particles stay in their
-        collision box
+        only draws, everything moves in update, alpha is how far the frame is
+        between the last two ticks and the feeder is drawn between the two positions
         """
-        def inner_particles_movement(particle, d):
-            if not self.inner_particles_collider.collidepoint(particle['loc']):
-                particle["loc"][0] -= particle["vel"][0] * d
-                particle["loc"][1] -= particle["vel"][1] * d
-                particle["vel"][0] *= -1
-                particle["vel"][1] *= -1
-
-            if not self.inner_particles_collider.collidepoint(particle['loc']):
-                particle["loc"] = [self.position.x - 5, self.position.y + self.radius]
-
-        self.particles.use(display, dt, lambda x, d: pygame.draw.circle(display, (0, 0, 0), (x["loc"][0] + 3, x["loc"][1] + 3), x["size"]))  # draws the food particles
-        for p in self.particles.objects:
-            if p["loc"][1] > self.ds[1]-self.ds[1]/6:
-                p["size"] = 0
-        pygame.draw.circle(display, (0, 0, 0), (self.position.x, self.position.y), 5, 2)  # draws the handle on the zip line
-        self.inner_particles.use(display, dt, inner_particles_movement)  # draws the inner particles
+        position = self.drawn_position = self.previous_position.lerp(self.position, alpha)
+        offset = tuple(position - self.position)
+
+        self.particles.draw(display, shadow=(3, 3))  # draws the food particles
+        pygame.draw.circle(display, (0, 0, 0), (position.x, position.y), 5, 2)  # draws the handle on the zip line
+        # draws the inner particles
+        self.inner_particles.draw(display, offset=offset)
         # this function draws the transparent globe
-        display.blit(self.globe, (self.position.x-self.radius, self.position.y-self.radius+self.radius+5), special_flags=pygame.BLEND_RGB_ADD)
+        display.blit(self.globe, (position.x-self.radius, position.y-self.radius+self.radius+5), special_flags=pygame.BLEND_RGB_ADD)
         # this function draws the lower part of the feeder
-        pygame.draw.rect(display, (0, 0, 0), (self.position.x-7.5+3, self.position.y+self.radius*2+3, 15, 20))
-        pygame.draw.rect(display, (150, 150, 150), (self.position.x-7.5, self.position.y+self.radius*2, 15, 20))
-        pygame.draw.ellipse(display, (0, 0, 0), (self.position.x-self.radius+3, self.position.y-self.radius+self.radius+self.radius+10+3, self.radius*2, 20))
-        pygame.draw.ellipse(display, (255, 0, 0), (self.position.x-self.radius, self.position.y-self.radius+self.radius+self.radius+10, self.radius*2, 20))
+        pygame.draw.rect(display, (0, 0, 0), (position.x-7.5+3, position.y+self.radius*2+3, 15, 20))
+        pygame.draw.rect(display, (150, 150, 150), (position.x-7.5, position.y+self.radius*2, 15, 20))
+        pygame.draw.ellipse(display, (0, 0, 0), (position.x-self.radius+3, position.y-self.radius+self.radius+self.radius+10+3, self.radius*2, 20))
+        pygame.draw.ellipse(display, (255, 0, 0), (position.x-self.radius, position.y-self.radius+self.radius+self.radius+10, self.radius*2, 20))
+
+    def bounding_rects(self) -> list:
+        # the parts of the display the feeder and its food draw into, used by the dirty rect renderer
+        position = self.drawn_position
+        return [
+            pygame.Rect(position.x-self.radius, position.y-5, self.radius*2+4, self.radius*2+10+20+3+6),
+            self.inner_particles.take_drawn_rect(),
+            self.particles.take_drawn_rect(),
+        ]
 
     def update(self, dt, mouse_press, mouse_position):
+        self.previous_position = pygame.Vector2(self.position)
 
         """
         this if statement calculates the speed and direction of the feeder
@@ -68,12 +83,13 @@ class Feeder:
         """
         if mouse_press[0]:
             self.direction = mouse_position[0] - self.position.x
+            food = self.rng.food
             self.particles.add(
                 [self.position[0], self.position[1] + self.radius*2+25],
-                rnd.randint(0, 180),
-                rnd.randint(1, 3) / 10,
-                rnd.randint(1, 2) * 5,
-                (rnd.randint(100, 170), rnd.randint(100, 170), rnd.randint(100, 170)),
+                food.randint(0, 180),
+                food.randint(1, 3) / 10,
+                food.randint(1, 2) * 5,
+                (food.randint(100, 170), food.randint(100, 170), food.randint(100, 170)),
                 0.01
             )
         else:
@@ -81,8 +97,7 @@ class Feeder:
 
         # moves the feeder and the inner particles with it
         self.position.x += self.direction / 20 * dt
-        for p in self.inner_particles.objects:
-            p["loc"][0] += self.direction / 20 * dt
+        self.inner_particles.loc[:, 0] += self.direction / 20 * dt
 
         # this makes it bounce when the feeder is outside the screen
         if self.position.x < 20:
@@ -100,19 +115,49 @@ class Feeder:
             20, 20
         )
 
+        # moves the food, the food that fell on the ground is gone
+        self.particles.step(dt)
+        self.particles.size[self.particles.loc[:, 1] > self.ds[1]-self.ds[1]/6] = 0
+        self.particles.remove_dead()
+        # moves the inner particles and makes sure they stay in their collision box
+        self.inner_particles.step(dt, bounds=self.inner_particles_collider, reset_position=(self.position.x - 5, self.position.y + self.radius))
+
 
 class Blob:
-    def __init__(self, ds):
+    def __init__(self, ds, rng: RandomStreams | None = None, clock: GameClock | None = None):
+        self.rng = rng or RandomStreams()
+        self.clock = clock or GameClock()  # the timers of the blob read this clock, it is moved by the simulation
+
+        self.particles = ParticleSystem("circle", 0.2)
+        self.inner_particles = ParticleSystem("circle", 0.0)  # the white particles inside the blob
+        self.outer_particles = ParticleSystem("circle", 0.0)
+
+        # sound effects
+        self.plop_sound = assets.sound("assets/sound_effects/the plop_sound.mp3")
+        self.explosion_sound = assets.sound("assets/sound_effects/explosion.mp3", 0.2)
+
+        # text and font
+        self.font = assets.font("assets/font/main-font.ttf", 25)
+
+        self.reset(ds)
+
+    def reset(self, ds):
+        """
+        puts the blob back in the state of a newly built one, the particle systems are
+        only cleared so a blob from the pool reuses their buffers
+        """
         self.ds = ds
 
         self.radius = 32
         self.position = pygame.Vector2(ds[0] / 2, ds[1]+30)
+        self.previous_position = pygame.Vector2(self.position)  # the position one tick ago, draw interpolates between the two
+        self.drawn_position = pygame.Vector2(self.position)
         self.dest = ds[1] - ds[1] / 6 - self.radius
         self.points = 10
 
         self.max_radius = 100
         self.mouth_collider = pygame.Rect(self.position.x - self.radius, self.position.y - self.radius, self.radius * 2, 10)
-        self.particles = ShapeParticles("circle", 0.2)
+        self.particles.clear()
 
         # colors
         self.const_body_color = [208, 208, 208]
@@ -122,16 +167,17 @@ class Blob:
         self.inner_particles_color = (220, 220, 220)
 
         # these particles are the white particles inside the blob
-        self.inner_particles = ShapeParticles("circle", 0.0)
+        cosmetic = self.rng.cosmetic
+        self.inner_particles.clear()
         for i in range(10):
-            self.inner_particles.add([self.position.x, self.position.y], rnd.randint(0, 360), rnd.randint(1, 2)/5, rnd.randint(int(self.radius/4), int(self.radius/3)), self.inner_particles_color, 0.0)
+            self.inner_particles.add([self.position.x, self.position.y], cosmetic.randint(0, 360), cosmetic.randint(1, 2)/5, cosmetic.randint(int(self.radius/4), int(self.radius/3)), self.inner_particles_color, 0.0)
 
         # this collider holds them in position, so they don't go outside the blob
         self.inner_particles_collider = pygame.Rect(self.position.x - self.radius, self.position.y - self.radius + self.radius / 2, self.radius * 2, self.radius * 2)
 
-        self.outer_particles = ShapeParticles("circle", 0.0)
+        self.outer_particles.clear()
         for i in range(20):
-            self.outer_particles.add([self.position.x, self.position.y], rnd.randint(0, 360), rnd.randint(1, 5)/5, rnd.randint(int(self.radius/2-5), int(self.radius/2)), tuple(self.body_color), 0.0)
+            self.outer_particles.add([self.position.x, self.position.y], cosmetic.randint(0, 360), cosmetic.randint(1, 5)/5, cosmetic.randint(int(self.radius/2-5), int(self.radius/2)), tuple(self.body_color), 0.0)
 
         # this collider holds them in position, so they don't go outside the blob
         self.outer_particles_collider = pygame.Rect(self.position.x - self.radius, self.position.y - self.radius + self.radius / 2, self.radius * 2, self.radius * 2)
@@ -139,80 +185,66 @@ class Blob:
         self.growth_speed = 0.1
 
         self.velocity = pygame.Vector2(0, 0)
-        self.direction = rnd.choice([-1, 1])
-        self.speed = rnd.randint(1, 3)
+        self.direction = self.rng.blobs.choice([-1, 1])
+        self.speed = self.rng.blobs.randint(1, 3)
 
         # timer
-        self.not_feed_timer = time.perf_counter()
+        self.not_feed_timer = self.clock.now()
         self.not_feed_time = 7
         self.not_feed = False
 
         self.alive = True
 
-        # sound effects
         self.plop_counter = 49
-        self.plop_sound = pygame.mixer.Sound("assets/sound_effects/the plop_sound.mp3")
-
-        self.explosion_sound = pygame.mixer.Sound("assets/sound_effects/explosion.mp3")
-        self.explosion_sound.set_volume(0.2)
 
-        # text and font
-        self.font = pygame.font.Font("assets/font/main-font.ttf", 25)
-        self.points_text = self.font.render(f"+{self.points}", True, (255, 0, 0))
+        self.points_text = assets.text(self.font, f"+{self.points}", (255, 0, 0))
         self.points_text_position = pygame.Vector2(self.position)
         self.points_text_timer = None
+        self.points_text_visible = False
+        self.points_text_rect = None
 
-    def draw(self, display, dt):
-        def inner_particles_move(particle, d):
-            if not self.inner_particles_collider.collidepoint(particle['loc']):
-                particle["loc"][0] -= particle["vel"][0] * d
-                particle["loc"][1] -= particle["vel"][1] * d
-                particle["vel"][0] *= -1
-                particle["vel"][1] *= -1
-
-            if not self.inner_particles_collider.collidepoint(particle['loc']):
-                particle["loc"] = [self.position.x, self.position.y]
-
-        def outer_particle_move(particle, d):
-            particle["color"] = self.body_color
-            if not self.outer_particles_collider.collidepoint(particle['loc']):
-                particle["loc"][0] -= particle["vel"][0] * d
-                particle["loc"][1] -= particle["vel"][1] * d
-                particle["vel"][0] *= -1
-                particle["vel"][1] *= -1
+    def spawn(self):
+        # restarts the timers, called when the blob enters the game because it could have been built long before that
+        self.not_feed_timer = self.clock.now()
 
-            if not self.outer_particles_collider.collidepoint(particle['loc']):
-                particle["loc"] = [self.position.x, self.position.y]
+    def draw(self, display, alpha: float = 1.0):
+        """
+        only draws, everything moves in update, alpha is how far the frame is
+        between the last two ticks and the blob is drawn between the two positions
+        """
+        position = self.drawn_position = self.previous_position.lerp(self.position, alpha)
+        offset = tuple(position - self.position)
 
         if self.alive:
             # drawing the outlines
-            for p in self.outer_particles.objects:
-                pygame.draw.circle(display, (0, 0, 0), (p["loc"][0]+3, p["loc"][1]+3), p["size"])
-            pygame.draw.ellipse(display, (0, 0, 0), (self.position.x - self.radius+3, self.position.y - self.radius + self.radius / 2+3, self.radius*2, self.radius * 2))
+            self.outer_particles.draw(display, (0, 0, 0), (offset[0] + 3, offset[1] + 3))
+            pygame.draw.ellipse(display, (0, 0, 0), (position.x - self.radius+3, position.y - self.radius + self.radius / 2+3, self.radius*2, self.radius * 2))
 
             # drawing the blob
-            self.outer_particles.use(display, dt, outer_particle_move)
-            pygame.draw.ellipse(display, self.body_color, (self.position.x - self.radius, self.position.y - self.radius + self.radius / 2, self.radius*2, self.radius * 2))
-            self.inner_particles.use(display, dt, inner_particles_move)
-            self.points_text_position = pygame.Vector2(self.position)
-        self.particles.use(display, dt, lambda x, d: pygame.draw.circle(display, (0, 0, 0), (x["loc"][0] + 3, x["loc"][1] + 3), x["size"]))
-
-        def inner_particles_move(particle, d):
-            if not self.inner_particles_collider.collidepoint(particle['loc']):
-                particle["loc"][0] -= particle["vel"][0]*d
-                particle["loc"][1] -= particle["vel"][1]*d
-                particle["vel"][0] *= -1
-                particle["vel"][1] *= -1
-        self.inner_particles.use(display, dt, inner_particles_move)
-
-        if not self.alive and self.radius >= self.max_radius:
-            if self.points_text_timer is None:
-                self.points_text_timer = time.perf_counter()
-            if time.perf_counter() - self.points_text_timer < 1:
-                display.blit(self.points_text, (self.points_text_position.x-self.points_text.get_width()/2, self.points_text_position.y))
-                self.points_text_position.y -= 0.5 * dt
+            self.outer_particles.draw(display, offset=offset)
+            pygame.draw.ellipse(display, self.body_color, (position.x - self.radius, position.y - self.radius + self.radius / 2, self.radius*2, self.radius * 2))
+            self.inner_particles.draw(display, offset=offset)
+        self.particles.draw(display, shadow=(3, 3))
+
+        if self.points_text_visible:
+            self.points_text_rect = display.blit(self.points_text, (self.points_text_position.x-self.points_text.get_width()/2, self.points_text_position.y))
+
+    def bounding_rects(self) -> list:
+        # the parts of the display the blob draws into, used by the dirty rect renderer
+        rects = [
+            self.particles.take_drawn_rect(),
+            self.inner_particles.take_drawn_rect(),
+            self.outer_particles.take_drawn_rect(),
+            self.points_text_rect,
+        ]
+        if self.alive:
+            position = self.drawn_position
+            rects.append(pygame.Rect(position.x - self.radius - 1, position.y - self.radius / 2 - 1, self.radius * 2 + 5, self.radius * 2 + 5))
+        self.points_text_rect = None
+        return rects
 
     def update(self, dt, foods, game_over):
+        self.previous_position = pygame.Vector2(self.position)
 
         # updates the colliders
         self.mouth_collider = pygame.Rect(self.position.x - self.radius, self.position.y - self.radius, self.radius * 2, self.radius*2)  # update collider
@@ -246,60 +278,55 @@ class Blob:
             self.velocity.y = -2
 
         self.position += self.velocity * dt
-        for p in self.inner_particles.objects:
-            p["loc"][0] += self.velocity.x
-            p["loc"][1] += self.velocity.y
-
-        for p in self.outer_particles.objects:
-            p["loc"][0] += self.velocity.x
-            p["loc"][1] += self.velocity.y
+        self.inner_particles.loc[:] += self.velocity * dt
+        self.outer_particles.loc[:] += self.velocity * dt
 
         # collision logic
         # feeding the blob
-        for food in foods:
-            if self.mouth_collider.collidepoint(food["loc"]) and self.radius < self.max_radius:
+        # foods is the SpatialHash of the food particles that main builds once every frame
+        eaten = foods.count(self.mouth_collider) if foods is not None else 0
+        for i in range(eaten):
+            if self.radius < self.max_radius:
                 self.plop_counter += 1
                 self.radius += self.growth_speed*dt
                 self.position.y -= self.growth_speed
                 self.not_feed_timer = 0
                 self.dest_color = self.const_dest_color.copy()
                 self.body_color = self.const_body_color.copy()
-                self.not_feed_timer = time.perf_counter()
-                for p in self.inner_particles.objects:
-                    p["size"] += self.growth_speed/2*dt
-                for p in self.outer_particles.objects:
-                    p["size"] += self.growth_speed/2*dt
+                self.not_feed_timer = self.clock.now()
+                self.inner_particles.size[:] += self.growth_speed/2*dt
+                self.outer_particles.size[:] += self.growth_speed/2*dt
 
         if self.radius >= self.max_radius and self.alive:
-            self.inner_particles.objects = []
-            self.outer_particles.objects = []
+            self.inner_particles.clear()
+            self.outer_particles.clear()
             self.not_feed_timer = 0
             if not game_over:
                 self.explosion_sound.play()
             self.not_feed = False
-            for i in range(100):
-                self.particles.add(
-                    [self.position.x, self.position.y],
-                    rnd.randint(0, 360),
-                    rnd.randint(100, 2000)/100,
-                    rnd.randint(40, 60),
-                    (255, 255, 255),
-                    0.5
-                )
-
-            for i in range(100):
-                self.particles.add(
-                    [self.position.x, self.position.y],
-                    rnd.randint(0, 360),
-                    rnd.randint(100, 1500)/100,
-                    rnd.randint(20, 40),
-                    (rnd.randint(self.const_body_color[0]-40, self.const_body_color[0]), rnd.randint(self.const_body_color[0]-40, self.const_body_color[0]), rnd.randint(self.const_body_color[0]-40, self.const_body_color[0])),
-                    0.1
-                )
+            # the explosion is added as two bursts of 100 particles instead of one particle at a time
+            explosion = self.rng.explosion
+            self.particles.add_many(
+                [self.position.x, self.position.y],
+                [explosion.randint(0, 360) for i in range(100)],
+                [explosion.randint(100, 2000)/100 for i in range(100)],
+                [explosion.randint(40, 60) for i in range(100)],
+                (255, 255, 255),
+                0.5
+            )
+
+            self.particles.add_many(
+                [self.position.x, self.position.y],
+                [explosion.randint(0, 360) for i in range(100)],
+                [explosion.randint(100, 1500)/100 for i in range(100)],
+                [explosion.randint(20, 40) for i in range(100)],
+                [(explosion.randint(self.const_body_color[0]-40, self.const_body_color[0]), explosion.randint(self.const_body_color[0]-40, self.const_body_color[0]), explosion.randint(self.const_body_color[0]-40, self.const_body_color[0])) for i in range(100)],
+                0.1
+            )
             self.alive = False
 
         # not feed logic
-        if time.perf_counter() - self.not_feed_timer > self.not_feed_time/2 and self.alive:
+        if self.clock.now() - self.not_feed_timer > self.not_feed_time/2 and self.alive:
             color = self.body_color.copy()
             self.body_color[0] += (self.dest_color[0] - self.body_color[0]) / 10
             self.body_color[0] = int(self.body_color[0])
@@ -314,9 +341,26 @@ class Blob:
                 elif self.dest_color == self.const_body_color:
                     self.dest_color = self.const_dest_color
 
-        if time.perf_counter() - self.not_feed_timer > self.not_feed_time and self.alive:
+        if self.clock.now() - self.not_feed_timer > self.not_feed_time and self.alive:
             self.not_feed = True
-            self.not_feed_timer = time.perf_counter()
+            self.not_feed_timer = self.clock.now()
+
+        # moves the particles, they are kept inside their colliders, so they don't go outside the blob
+        if self.alive:
+            self.outer_particles.color[:] = self.body_color
+            self.outer_particles.step(dt, bounds=self.outer_particles_collider, reset_position=self.position)
+            self.inner_particles.step(dt, bounds=self.inner_particles_collider, reset_position=self.position)
+            self.points_text_position = pygame.Vector2(self.position)
+        self.particles.step(dt)
+
+        # the points float up for a second after the blob exploded
+        self.points_text_visible = False
+        if not self.alive and self.radius >= self.max_radius:
+            if self.points_text_timer is None:
+                self.points_text_timer = self.clock.now()
+            if self.clock.now() - self.points_text_timer < 1:
+                self.points_text_visible = True
+                self.points_text_position.y -= 0.5 * dt
 
         # sound logic
         if self.plop_counter > 50:
@@ -325,12 +369,12 @@ class Blob:
 
 
 class SpeedBlob(Blob):
-    def __init__(self, ds):
-        super().__init__(ds)
+    def reset(self, ds):
+        super().reset(ds)
 
-        self.speed = rnd.randint(3, 6)
+        self.speed = self.rng.blobs.randint(3, 6)
         self.max_radius = 50
-        self.radius = rnd.randint(20, 25)
+        self.radius = self.rng.blobs.randint(20, 25)
         self.body_color = [100, 0, 255]
         self.const_body_color = [100, 0, 255]
         self.const_dest_color = [255, 0, 0]
@@ -340,17 +384,19 @@ class SpeedBlob(Blob):
 
         self.dest = ds[1] - ds[1] / 6 - self.radius
 
-        self.points_text = self.font.render(f"+{self.points}", True, (255, 0, 0))
+        self.points_text = assets.text(self.font, f"+{self.points}", (255, 0, 0))
 
 
 class HeavyBlob(Blob):
-    def __init__(self, ds):
-        super().__init__(ds)
+    def reset(self, ds):
+        super().reset(ds)
 
-        self.speed = rnd.randint(1, 2)/2
+        self.speed = self.rng.blobs.randint(1, 2)/2
         self.max_radius = 200
-        self.radius = rnd.randint(100, 120)
+        self.radius = self.rng.blobs.randint(100, 120)
         self.position = pygame.Vector2(ds[0] / 2, ds[1] + self.radius/2)
+        self.previous_position = pygame.Vector2(self.position)
+        self.drawn_position = pygame.Vector2(self.position)
         self.body_color = [150, 50, 0]
         self.const_body_color = [150, 50, 0]
         self.const_dest_color = [255, 0, 0]
@@ -361,16 +407,16 @@ class HeavyBlob(Blob):
 
         self.dest = ds[1] - ds[1] / 6 - self.radius
 
-        self.points_text = self.font.render(f"+{self.points}", True, (255, 0, 0))
+        self.points_text = assets.text(self.font, f"+{self.points}", (255, 0, 0))
 
 
 class RandomBlob(Blob):
-    def __init__(self, ds):
-        super().__init__(ds)
+    def reset(self, ds):
+        super().reset(ds)
 
-        self.speed = rnd.randint(1, 2)
+        self.speed = self.rng.blobs.randint(1, 2)
         self.max_radius = 75
-        self.radius = rnd.randint(20, 35)
+        self.radius = self.rng.blobs.randint(20, 35)
         self.growth_speed = 0.05
         self.body_color = [150, 150, 250]
         self.const_body_color = [150, 150, 250]
@@ -381,15 +427,19 @@ class RandomBlob(Blob):
 
         self.dest = ds[1] - ds[1] / 6 - self.radius
 
-        self.points_text = self.font.render(f"+{self.points}", True, (255, 0, 0))
+        self.points_text = assets.text(self.font, f"+{self.points}", (255, 0, 0))
+
+        self.change_dir_timer = self.clock.now()
+        self.change_dir_time = self.rng.blobs.randint(1, 6)
 
-        self.change_dir_timer = time.perf_counter()
-        self.change_dir_time = rnd.randint(1, 6)
+    def spawn(self):
+        super().spawn()
+        self.change_dir_timer = self.clock.now()
 
     def update(self, dt, foods, game_over):
-        if time.perf_counter() - self.change_dir_timer > self.change_dir_time:
-            self.direction = rnd.choice([1, -1])
-            self.change_dir_timer = time.perf_counter()
-            self.change_dir_time = rnd.randint(1, 6)
+        if self.clock.now() - self.change_dir_timer > self.change_dir_time:
+            self.direction = self.rng.blobs.choice([1, -1])
+            self.change_dir_timer = self.clock.now()
+            self.change_dir_time = self.rng.blobs.randint(1, 6)
 
         super().update(dt, foods, game_over)
@@ -0,0 +1,145 @@
+"""
+a small retained gui, the screens are built once as a tree of widgets
+where every widget is positioned relative to its parent, so moving a whole
+screen is just moving its root and nothing has to be laid out again every frame
+"""
+import pygame
+
+import assets
+
+
+class Widget:
+    def __init__(self, position=(0, 0), children: list | None = None):
+        self.position = pygame.Vector2(position)  # relative to the parent
+        self.parent = None
+        self.children = []
+        self._last_state = None
+        self._last_rect = None
+        for child in children or []:
+            self.add(child)
+
+    def add(self, child):
+        child.parent = self
+        self.children.append(child)
+        return child
+
+    def absolute_position(self) -> pygame.Vector2:
+        if self.parent is None:
+            return pygame.Vector2(self.position)
+        return self.parent.absolute_position() + self.position
+
+    def draw(self, surf: pygame.Surface, origin=(0, 0)) -> None:
+        position = pygame.Vector2(origin) + self.position
+        self.draw_self(surf, position)
+        for child in self.children:
+            child.draw(surf, position)
+
+    def draw_self(self, surf: pygame.Surface, position: pygame.Vector2) -> None:
+        pass
+
+    def bounding_rect(self, origin=(0, 0)) -> pygame.Rect | None:
+        # the part of the display the widget and its children draw into
+        position = pygame.Vector2(origin) + self.position
+        rects = [child.bounding_rect(position) for child in self.children]
+        rects = [rect for rect in [self.rect_self(position)] + rects if rect is not None]
+        return rects[0].unionall(rects[1:]) if rects else None
+
+    def rect_self(self, position: pygame.Vector2) -> pygame.Rect | None:
+        return None
+
+    def state(self) -> tuple:
+        # everything that changes how the widget looks
+        return (tuple(self.position), getattr(self, "color", None), getattr(self, "text", None), tuple(child.state() for child in self.children))
+
+    def dirty_rect(self) -> pygame.Rect | None:
+        """
+        the part of the display that has to be presented again because the widget changed
+        since the last call (the old and the new area), None when nothing changed
+        """
+        state = self.state()
+        if state == self._last_state:
+            return None
+        rect = self.bounding_rect()
+        dirty = rect if self._last_rect is None else rect.union(self._last_rect)
+        self._last_state, self._last_rect = state, rect
+        return dirty
+
+
+class Panel(Widget):
+    # a rectangle centered on its position with a black shadow under it
+    def __init__(self, position, size: tuple, color: tuple, shadow: int = 3, children: list | None = None):
+        super().__init__(position, children)
+        self.size = size
+        self.color = color
+        self.shadow = shadow
+
+    def rect_at(self, position) -> pygame.Rect:
+        return pygame.Rect(position[0] - self.size[0] / 2, position[1] - self.size[1] / 2, self.size[0], self.size[1])
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return self.rect_at(self.absolute_position())
+
+    def rect_self(self, position):
+        return self.rect_at(position).inflate(2, 2).move(self.shadow, self.shadow).union(self.rect_at(position).inflate(2, 2))
+
+    def draw_self(self, surf, position):
+        rect = self.rect_at(position)
+        if self.shadow:
+            pygame.draw.rect(surf, (0, 0, 0), (rect.x + self.shadow, rect.y + self.shadow, rect.w, rect.h))
+        pygame.draw.rect(surf, self.color, rect)
+
+
+class Label(Widget):
+    """
+    text centered on its position (or hanging from it with anchor="top"),
+    the text surfaces are only fetched again when set_text changes the text
+    """
+    def __init__(self, position, font: pygame.font.Font, text: str, color: tuple, shadow: int = 0, anchor: str = "center"):
+        super().__init__(position)
+        self.font = font
+        self.color = color
+        self.shadow = shadow
+        self.anchor = anchor
+
+        self.text = None
+        self.surf = None
+        self.shadow_surf = None
+        self.set_text(text)
+
+    def set_text(self, text: str) -> None:
+        if text == self.text:
+            return
+        self.text = text
+        self.surf = assets.text(self.font, text, self.color)
+        self.shadow_surf = assets.text(self.font, text, (0, 0, 0)) if self.shadow else None
+
+    def top_left(self, position) -> tuple:
+        x = position.x - self.surf.get_width() / 2
+        y = position.y - self.surf.get_height() / 2 if self.anchor == "center" else position.y
+        return x, y
+
+    def rect_self(self, position):
+        rect = self.surf.get_rect(topleft=self.top_left(position)).inflate(2, 2)
+        return rect.union(rect.move(self.shadow, self.shadow))
+
+    def draw_self(self, surf, position):
+        x, y = self.top_left(position)
+        if self.shadow_surf is not None:
+            surf.blit(self.shadow_surf, (x + self.shadow, y + self.shadow))
+        surf.blit(self.surf, (x, y))
+
+
+class Button(Panel):
+    # a panel with a label on it that changes color while the mouse is over it
+    def __init__(self, position, size: tuple, color: tuple, hover_color: tuple, label: Label):
+        super().__init__(position, size, color, children=[label])
+        self.normal_color = color
+        self.hover_color = hover_color
+        self.label = label
+        self.hovered = False
+
+    def update(self, mouse_position) -> bool:
+        self.hovered = bool(self.rect.collidepoint(mouse_position))
+        self.color = self.hover_color if self.hovered else self.normal_color
+        return self.hovered
@@ -0,0 +1,102 @@
+"""
+runs the game logic without a window, sound or frame cap, driven by scripted input
+or a bot, and reports how many ticks it simulated per second, from the root of the repo:
+    python headless.py --ticks 20000 --seed 0 --input bot
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # no window and no sound, so it also runs on machines without a display
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import argparse
+import sys
+import time
+
+from simulation import Simulation
+from rng import RandomStreams
+
+DS = 600, 600
+
+
+def sweeping_mouse(tick: int, simulation: Simulation) -> tuple:
+    """
+    the default input script, the mouse sweeps from side to side over 8 seconds
+    and the button is held for 3 out of every 4 seconds, returns (mouse_press, mouse_position)
+    """
+    ds = simulation.ds
+    phase = tick % 480 / 480
+    x = ds[0] * (0.1 + 0.8 * (1 - abs(phase * 2 - 1)))
+    return (tick % 240 < 180, False, False), (x, ds[1] / 2)
+
+
+def hungriest_blob(tick: int, simulation: Simulation) -> tuple:
+    """
+    a bot that keeps the button down and moves the feeder over the blob that ate the longest
+    time ago, aiming where the blob will be when the food reaches the ground
+    """
+    alive = [b for b in simulation.blobs if b.alive]
+    if not alive:
+        return (False, False, False), (simulation.feeder.position.x, simulation.ds[1] / 2)
+
+    blob = min(alive, key=lambda b: b.not_feed_timer)
+    fall_ticks = 55  # about how long a food particle takes from the feeder to a blob
+    return (True, False, False), (blob.position.x + blob.velocity.x * fall_ticks, simulation.ds[1] / 2)
+
+
+INPUT_SCRIPTS = {"sweep": sweeping_mouse, "bot": hungriest_blob}
+
+
+def run(ticks: int, seed: int = 0, ds: tuple = DS, input_script=sweeping_mouse, dt: float = 1.0) -> dict:
+    """
+    simulates ticks ticks as fast as possible, a new game starts every time one is lost,
+    returns the throughput and a few numbers about what was simulated
+    """
+    simulation = Simulation(ds, rng=RandomStreams(seed))
+
+    games = 1
+    max_blobs = 0
+    max_particles = 0
+    start = time.perf_counter()
+    for tick in range(ticks):
+        mouse_press, mouse_position = input_script(tick, simulation)
+        simulation.tick(dt, mouse_press, mouse_position)
+
+        max_blobs = max(max_blobs, len(simulation.blobs))
+        max_particles = max(max_particles, simulation.particle_count())
+        if simulation.game_over and not simulation.blobs:
+            simulation.reset()
+            games += 1
+    seconds = time.perf_counter() - start
+
+    return {
+        "ticks": ticks,
+        "seconds": seconds,
+        "ticks_per_second": ticks / seconds if seconds else float("inf"),
+        "games": games,
+        "points": simulation.points,
+        "max_blobs": max_blobs,
+        "max_particles": max_particles,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--input", choices=INPUT_SCRIPTS, default="sweep", help="what plays the game")
+    args = parser.parse_args()
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))  # the assets are loaded relative to the repo
+    pygame.init()
+
+    result = run(args.ticks, args.seed, input_script=INPUT_SCRIPTS[args.input])
+    for key, value in result.items():
+        print(f"{key}: {round(value, 2) if isinstance(value, float) else value}")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
+    sys.exit()
@@ -1,14 +1,23 @@
 import pygame
 from pygame.locals import *
-from xfps import ShapeParticles  # my own library for particles
+from particles import ParticleSystem  # numpy version of the particles from my xfps library
+import particles
 
 import time
-import random as rnd
 import math
 import sys
 import os
 
 from entities import *
+from simulation import Simulation
+from background import StripeBackground
+from renderer import DirtyRectRenderer, Presenter
+from timestep import FixedTimestep
+import assets
+from screens import Screens
+from profiler import Profiler
+from rng import RandomStreams
+from replay import Recorder
 
 
 def main() -> None:
@@ -27,41 +36,59 @@ def main() -> None:
     display = pygame.Surface(DS)
     clock = pygame.time.Clock()
 
+    """
+    with --dirty-rects only the parts of the display that changed are redrawn and presented,
+    the background does not move in this mode because a moving background changes every pixel
+    """
+    dirty_rects = "--dirty-rects" in sys.argv
+    particles.track_drawn = dirty_rects  # the particles only work out where they drew when something uses it
+    renderer = DirtyRectRenderer(DS)
+    presenter = Presenter()
+
+    """
+    with --profile every stage of every frame is timed, the percentiles are shown in the corner
+    and every frame is written to --profile-output (frame_times.csv or a .json file) when the game closes
+    """
+    profiler = Profiler("--profile" in sys.argv)
+    profile_output = next((arg.split("=", 1)[1] for arg in sys.argv if arg.startswith("--profile-output=")), "frame_times.csv")
+    profiler_font = assets.font(None, 18)
+
     # assets
-    ground_sprite = pygame.image.load("assets/sprites/ground.png").convert()
-    ground_sprite.set_colorkey((255, 255, 255))
+    ground_sprite = assets.image("assets/sprites/ground.png", (255, 255, 255))
 
-    icon_sprite = pygame.image.load("assets/sprites/icon.png").convert()
+    icon_sprite = assets.image("assets/sprites/icon.png")
+    pygame.display.set_icon(icon_sprite)
+    pygame.display.set_caption("feed the bunny")
 
-    mouse_pressed_spr = pygame.image.load("assets/sprites/mouse_pressed.png").convert()
-    mouse_pressed_spr.set_colorkey((255, 255, 255))
+    mouse_pressed_spr = assets.image("assets/sprites/mouse_pressed.png", (255, 255, 255))
 
-    mouse_not_pressed_spr = pygame.image.load("assets/sprites/mouse_not_pressed.png").convert()
-    mouse_not_pressed_spr.set_colorkey((255, 255, 255))
+    mouse_not_pressed_spr = assets.image("assets/sprites/mouse_not_pressed.png", (255, 255, 255))
 
     mouse_sprs = [mouse_pressed_spr, mouse_not_pressed_spr]
     mouse_sprs_index = 1
 
-    button_press_sound = pygame.mixer.Sound("assets/sound_effects/button_press.mp3")
+    button_press_sound = assets.sound("assets/sound_effects/button_press.mp3")
 
     pygame.mixer.music.load("assets/music/music-for-game.mp3")
     pygame.mixer.music.set_volume(0.1)
 
     pygame.mixer.music.play(-1)
 
-    main_font = pygame.font.Font("assets/font/main-font.ttf", 40)
-    secondary_font = pygame.font.Font("assets/font/main-font.ttf", 25)
-    small_font = pygame.font.Font("assets/font/main-font.ttf", 18)
-    title_font = pygame.font.Font("assets/font/title-font.ttf", 70)
-
-    # logic variables
     # logic variables
-    points = 0
-    background_points = [[i] for i in range(-200, DS[1] + 100, 100)]
-    background_particles = ShapeParticles("circle", 0.0)
+    background = StripeBackground(DS, speed=0 if dirty_rects else 2)
+
+    def build_backdrop():
+        # the parts of the screen that never move, the dirty rect renderer cleans the display with it
+        surf = pygame.Surface(DS)
+        surf.fill((230, 229, 0))
+        background.draw(surf)
+        pygame.draw.line(surf, (0, 0, 0), (0, 60), (DS[1], 60), 3)  # rail of the feeder
+        return surf
+
+    backdrop = build_backdrop()
+    background_particles = ParticleSystem("circle", 0.0)
     display_offset = [0, 0]
-    game_over = False
-    game_over_sound = pygame.mixer.Sound("assets/sound_effects/game-over-sound.mp3")
+    game_over_sound = assets.sound("assets/sound_effects/game-over-sound.mp3")
 
     game_over_gui_position = pygame.Vector2(DS[0]/2, DS[1]/2-600)
     game_over_gui_dest_position = pygame.Vector2(DS[0]/2, DS[1]/2)
@@ -82,31 +109,43 @@ def main() -> None:
     tutorial_mouse_dest_positions = [pygame.Vector2(DS[0]/2-120, DS[1]/2-10), pygame.Vector2(0, 0), pygame.Vector2(DS[0]/2+60, DS[1]/2-10), pygame.Vector2(0, 0)]
     tutorial_mouse_dest_position = pygame.Vector2(DS[0]/2-120, DS[1]/2)
 
-    tutorial_blob = Blob(DS)
+    enter_pressed = False
+
+    # the gui screens, they are built once and moved around by the position of their root
+    screens = Screens(game_started_gui_position, tutorial_gui_position, game_over_gui_position)
+    play_button, menu_quit_button, game_started_gui = screens.play_button, screens.menu_quit_button, screens.menu
+    tutorial_gui = screens.tutorial
+    reset_button, game_over_quit_button, score_label, game_over_gui = screens.reset_button, screens.game_over_quit_button, screens.score_label, screens.game_over
+
+    # with --seed=N the game draws the same random numbers every time it is played
+    seed = next((int(arg.split("=", 1)[1]) for arg in sys.argv if arg.startswith("--seed=")), None)
+    simulation = Simulation(DS, profiler=profiler, rng=RandomStreams(seed))  # the feeder, the blobs and the score
+    cosmetic = simulation.rng.cosmetic
+    game_clock = simulation.clock  # the timers below read the time of the game, which only moves when it ticks
+
+    tutorial_blob = Blob(DS, clock=game_clock)  # it has its own random streams so it does not change what the game draws
     tutorial_blob.speed = 0
     tutorial_blob.mouth_collider = pygame.Rect(0, 0, 0, 0)
 
-    enter_pressed = False
+    # with --record=session.ftb the input of every tick is written to session.ftb so replay.py can play the game again
+    recorder = Recorder(next((arg.split("=", 1)[1] for arg in sys.argv if arg.startswith("--record=")), None), simulation)
 
-    feeder = Feeder(DS)
-    blobs = []
+    # the game logic runs in ticks of 1/60 of a second, drawing happens once per frame in between them
+    timestep = FixedTimestep(60)
 
     # timers
-    last_time = time.perf_counter()
-    spawn_timer = time.perf_counter()
-    spawn_time = 2
+    bg_particle_timer = game_clock.now()
 
-    bg_particle_timer = time.perf_counter()
+    caption_timer = time.perf_counter()  # the caption shows the real frame rate, so it stays on the real clock
 
-    tutorial_mouse_pressed_timer = time.perf_counter()
+    tutorial_mouse_pressed_timer = game_clock.now()
 
     done = False
     while not done:
 
-        # calculating the delta time
-        dt = time.perf_counter() - last_time
-        dt *= 60
-        last_time = time.perf_counter()
+        # how many ticks fit in the time since the last frame, dt is the time they simulate together
+        ticks = timestep.advance()
+        dt = ticks * timestep.dt
 
         # input methods
         keys = pygame.key.get_pressed()
@@ -121,288 +160,178 @@ def main() -> None:
             pygame.mouse.get_pos()[1] * ZOOM[1] - display_offset[1] * ZOOM[1]
         ]
 
-        # logic of the game objects and entities
-        if time.perf_counter() - spawn_timer > spawn_time*dt and not game_over and game_started and not tutorial:
-            the_blob = rnd.choices([Blob(DS), SpeedBlob(DS), HeavyBlob(DS), RandomBlob(DS)], weights=[4, 8, 2, 3])
-            blobs.append(the_blob[0])
-            spawn_timer = time.perf_counter()
+        # logic of the game objects and entities, it always advances in whole ticks so it does not depend on the frame rate
+        simulation.spawning = game_started and not tutorial
+        for tick in range(ticks):
+            if not dirty_rects:
+                with profiler.timer("background"):
+                    background_particles.step(timestep.dt)
+                    background.update(timestep.dt)
+
+            game_over = simulation.game_over
+            recorder.tick(timestep.dt, mouse_press, mouse_position)
+            simulation.tick(timestep.dt, mouse_press, mouse_position)
+            if simulation.game_over and not game_over:
+                game_over_sound.play()
+                pygame.mixer.music.stop()
 
-        if time.perf_counter() - bg_particle_timer > 0.1:
-            background_particles.add([0, DS[1]], rnd.randint(-90, 0), rnd.randint(1, 3), rnd.randint(60, 100),
+        if game_clock.now() - bg_particle_timer > 0.1 and not dirty_rects:
+            background_particles.add([0, DS[1]], cosmetic.randint(-90, 0), cosmetic.randint(1, 3), cosmetic.randint(60, 100),
                                      (200, 100, 0), 0.5)
-            background_particles.add([DS[0], 0], rnd.randint(90, 180), rnd.randint(1, 3), rnd.randint(60, 100),
+            background_particles.add([DS[0], 0], cosmetic.randint(90, 180), cosmetic.randint(1, 3), cosmetic.randint(60, 100),
                                      (200, 100, 0), 0.5)
-            bg_particle_timer = time.perf_counter()
-
-        feeder.update(dt, mouse_press, mouse_position)
+            bg_particle_timer = game_clock.now()
 
         # drawing on the screen
-        display.fill((230, 229, 0))
+        with profiler.timer("background"):
+            if dirty_rects:
+                renderer.restore(display, backdrop)
+            else:
+                display.fill((230, 229, 0))
 
-        # drawing the background
-        background_particles.use(display, dt)
-        for bp in background_points:
-            bp[0] += 2 * dt
-            pygame.draw.line(display, (230, 122, 0), (-10, bp[0]), (DS[0] + 10, bp[0] + 100), 40)
-            if bp[0] > DS[1] + 100:
-                bp[0] = -200
+                # drawing the background
+                background_particles.draw(display)
+                background.draw(display)
 
-        # drawing the feeder
-        pygame.draw.line(display, (0, 0, 0), (0, 60), (DS[1], 60), 3)  # rail of the feeder
-        feeder.draw(display, dt)
+                pygame.draw.line(display, (0, 0, 0), (0, 60), (DS[1], 60), 3)  # rail of the feeder
 
-        # drawing the blobs
-        for b in sorted(blobs, key=lambda i: i.radius, reverse=True):
-            b.update(dt, feeder.particles.objects, game_over)
-            b.draw(display, dt)
-            if b.not_feed:
-                for x in blobs:
-                    x.radius = x.max_radius
-                game_over = True
-                game_over_sound.play()
-                pygame.mixer.music.stop()
-            if not b.alive and b.particles.objects == []:
-                blobs.remove(b)
+        # drawing the feeder, the moving things are drawn between the last two ticks
+        with profiler.timer("feeder draw"):
+            simulation.feeder.draw(display, timestep.alpha)
+            if dirty_rects:
+                for rect in simulation.feeder.bounding_rects():
+                    renderer.mark(rect)
 
-            if not game_over and not b.alive:
-                points += b.points
-                b.points = 0
+        # drawing the blobs
+        with profiler.timer("blob draw"):
+            for b in sorted(simulation.blobs, key=lambda i: i.radius, reverse=True):
+                b.draw(display, timestep.alpha)
+                if dirty_rects:
+                    for rect in b.bounding_rects():
+                        renderer.mark(rect)
 
         # draw the bunny platform
         display.blit(ground_sprite, (0, DS[1] - DS[1]/6-10))
 
-        # drawing the Game Not Started GUI
-        if not game_started:
-
-            game_started_gui_position.x += (game_started_gui_dest_position.x - game_started_gui_position.x) / 20*dt
-            game_started_gui_position.y += (game_started_gui_dest_position.y - game_started_gui_position.y) / 20*dt
-
-            game_started_gui = {
-                "title_text": title_font.render("feed-the-blob", True, (0, 0, 255)),
-                "title_text_shadow": title_font.render("feed-the-blob", True, (0, 0, 0)),
+        with profiler.timer("gui"):
+            # drawing the Game Not Started GUI
+            if not game_started:
 
-                "play_button_rect": pygame.Rect(game_started_gui_position.x-80/2, game_started_gui_position.y-50/2-30, 80, 50),
-                "play_button_text": secondary_font.render("PLAY", True, (255, 255, 255)),
-                "play_button_color":  (0, 255, 0),
+                game_started_gui_position.x += (game_started_gui_dest_position.x - game_started_gui_position.x) / 20*dt
+                game_started_gui_position.y += (game_started_gui_dest_position.y - game_started_gui_position.y) / 20*dt
 
-                "quit_button_rect": pygame.Rect(game_started_gui_position.x-80/2, game_started_gui_position.y-50/2+50, 80, 50),
-                "quit_button_text": secondary_font.render("QUIT", True, (255, 255, 255)),
-                "quit_button_color": (0, 255, 0),
-            }
+                game_started_gui.position = pygame.Vector2(game_started_gui_position)
 
-            # tile
-            display.blit(game_started_gui["title_text_shadow"], (game_started_gui_position.x-game_started_gui["title_text_shadow"].get_width()/2+3, game_started_gui_position.y-game_started_gui["title_text_shadow"].get_height()/2-180+3))
-            display.blit(game_started_gui["title_text"], (game_started_gui_position.x-game_started_gui["title_text"].get_width()/2, game_started_gui_position.y-game_started_gui["title_text"].get_height()/2-180))
-
-            # button logic
-
-            if game_started_gui["play_button_rect"].collidepoint(mouse_position):
-                game_started_gui["play_button_color"] = (0, 200, 0)
-                if mouse_press[0] and not play_button_pressed:
-                    button_press_sound.play()
-                    play_button_pressed = True
-                    game_started_gui_dest_position = pygame.Vector2(game_started_gui_position.x, game_started_gui_position.y-600)
-                elif not mouse_press[0]:
+                # button logic
+                if play_button.update(mouse_position):
+                    if mouse_press[0] and not play_button_pressed:
+                        button_press_sound.play()
+                        play_button_pressed = True
+                        game_started_gui_dest_position = pygame.Vector2(game_started_gui_position.x, game_started_gui_position.y-600)
+                    elif not mouse_press[0]:
+                        play_button_pressed = False
+                else:
                     play_button_pressed = False
-            else:
-                play_button_pressed = False
-                game_started_gui["play_button_color"] = (0, 255, 0)
-
-            if game_started_gui["quit_button_rect"].collidepoint(mouse_position):
-                game_started_gui["quit_button_color"] = (200, 0, 0)
-                if mouse_press[0] and game_started_gui_dest_position == game_started_gui_position:
-                    button_press_sound.play()
-                    done = True
-            else:
-                game_started_gui["quit_button_color"] = (255, 0, 0)
-
-            # buttons
-            pygame.draw.rect(display, (0, 0, 0), (game_started_gui["play_button_rect"].x+3, game_started_gui["play_button_rect"].y+3, game_started_gui["play_button_rect"].w, game_started_gui["play_button_rect"].h))
-            pygame.draw.rect(display, game_started_gui["play_button_color"], game_started_gui["play_button_rect"])
-
-            pygame.draw.rect(display, (0, 0, 0), (game_started_gui["quit_button_rect"].x+3, game_started_gui["quit_button_rect"].y+3, game_started_gui["quit_button_rect"].w, game_started_gui["quit_button_rect"].h))
-            pygame.draw.rect(display, game_started_gui["quit_button_color"], game_started_gui["quit_button_rect"])
-
-            # button text
-            display.blit(
-                game_started_gui["play_button_text"],
-                (game_started_gui_position.x - game_started_gui["play_button_text"].get_width() / 2, game_started_gui_position.y-game_started_gui["play_button_text"].get_height()/2-26)
-            )
-
-            display.blit(
-                game_started_gui["quit_button_text"],
-                (game_started_gui_position.x - game_started_gui["quit_button_text"].get_width() / 2, game_started_gui_position.y-game_started_gui["quit_button_text"].get_height()/2+54)
-            )
-
-            if game_started_gui_position.y < -100:
-                game_started = True
-                tutorial = True
-
-        # drawing the Tutorial GUI
-        if tutorial:
-            tutorial_gui_position.x += (tutorial_gui_dest_position.x - tutorial_gui_position.x) / 20*dt
-            tutorial_gui_position.y += (tutorial_gui_dest_position.y - tutorial_gui_position.y) / 20*dt
-            tutorial_mouse_position.x += (tutorial_gui_dest_position.x - tutorial_gui_position.x) / 20*dt
-            tutorial_mouse_position.y += (tutorial_gui_dest_position.y - tutorial_gui_position.y) / 20*dt
-
-            tutorial_mouse_dest_positions = [pygame.Vector2(tutorial_gui_position.x - 120, tutorial_gui_position.y - 10), pygame.Vector2(0, 0),
-                                             pygame.Vector2(tutorial_gui_position.x + 60, tutorial_gui_position.y - 10), pygame.Vector2(0, 0)]
-            tutorial_mouse_dest_position = tutorial_mouse_dest_positions[tutorial_mouse_position_index]
-
-            if not mouse_sprs_index:
-                tutorial_mouse_position.x += (tutorial_mouse_dest_position.x - tutorial_mouse_position.x) / 20*dt
-                tutorial_mouse_position.y += (tutorial_mouse_dest_position.y - tutorial_mouse_position.y) / 20*dt
-
-            tutorial_gui = {
-                "outer_window1": pygame.Rect(tutorial_gui_position.x-440/2, tutorial_gui_position.y-220/2, 440, 220),
-                "inner_window1": pygame.Rect(tutorial_gui_position.x-400/2, tutorial_gui_position.y-180/2, 400, 180),
-
-                "1line1": small_font.render("control the feeder by holding the left mouse button", True, (255, 255, 0)),
-                "1line2": small_font.render("and by dragging the mouse around", True, (255, 255, 0)),
-                "1line1s": small_font.render("control the feeder by holding the left mouse button", True, (0, 0, 0)),
-                "1line2s": small_font.render("and by dragging the mouse around", True, (0, 0, 0)),
-                "1line3": small_font.render("press Enter", True, (255, 255, 0)),
-                "1line3s": small_font.render("press Enter", True, (0, 0, 0)),
-
-                "outer_window2": pygame.Rect(tutorial_gui_position.x-440/2+600, tutorial_gui_position.y-220/2, 440, 220),
-                "inner_window2": pygame.Rect(tutorial_gui_position.x-400/2+600, tutorial_gui_position.y-180/2, 400, 180),
-
-                "2line1": small_font.render("when the blob blinks red its going to explode", True, (255, 255, 0)),
-                "2line2": small_font.render("when it explodes this way its you lose the game", True, (255, 255, 0)),
-                "2line1s": small_font.render("when the blob blinks red its going to explode", True, (0, 0, 0)),
-                "2line2s": small_font.render("when it explodes this way its you lose the game", True, (0, 0, 0)),
-                "2line3": small_font.render("press Enter", True, (255, 255, 0)),
-                "2line3s": small_font.render("press Enter", True, (0, 0, 0)),
-            }
-
-            # drawing the windows
-            pygame.draw.rect(display, (0, 0, 0), (tutorial_gui["outer_window1"].x+3, tutorial_gui["outer_window1"].y+3, tutorial_gui["outer_window1"].w, tutorial_gui["outer_window1"].h))
-            pygame.draw.rect(display, (100, 150, 0), tutorial_gui["outer_window1"])
-            pygame.draw.rect(display, (0, 0, 0), (tutorial_gui["inner_window1"].x+3, tutorial_gui["inner_window1"].y+3, tutorial_gui["inner_window1"].w, tutorial_gui["inner_window1"].h))
-            pygame.draw.rect(display, (100, 100, 100), tutorial_gui["inner_window1"])
-
-            pygame.draw.rect(display, (0, 0, 0), (tutorial_gui["outer_window2"].x+3, tutorial_gui["outer_window2"].y+3, tutorial_gui["outer_window2"].w, tutorial_gui["outer_window2"].h))
-            pygame.draw.rect(display, (100, 150, 0), tutorial_gui["outer_window2"])
-            pygame.draw.rect(display, (0, 0, 0), (tutorial_gui["inner_window2"].x+3, tutorial_gui["inner_window2"].y+3, tutorial_gui["inner_window2"].w, tutorial_gui["inner_window2"].h))
-            pygame.draw.rect(display, (100, 100, 100), tutorial_gui["inner_window2"])
-
-            # drawing text
-            display.blit(tutorial_gui["1line1s"], (tutorial_gui_position.x-tutorial_gui["1line1s"].get_width()/2+3, tutorial_gui_position.y-tutorial_gui["1line1s"].get_height()/2-60+3))
-            display.blit(tutorial_gui["1line1"], (tutorial_gui_position.x-tutorial_gui["1line1"].get_width()/2, tutorial_gui_position.y-tutorial_gui["1line1"].get_height()/2-60))
-            display.blit(tutorial_gui["1line2s"], (tutorial_gui_position.x-tutorial_gui["1line2s"].get_width()/2+3, tutorial_gui_position.y-tutorial_gui["1line2s"].get_height()/2-40+3))
-            display.blit(tutorial_gui["1line2"], (tutorial_gui_position.x-tutorial_gui["1line2"].get_width()/2, tutorial_gui_position.y-tutorial_gui["1line2"].get_height()/2-40))
-            display.blit(tutorial_gui["1line3s"], (tutorial_gui_position.x-tutorial_gui["1line3s"].get_width()/2+3, tutorial_gui_position.y-tutorial_gui["1line3s"].get_height()/2+75+3))
-            display.blit(tutorial_gui["1line3"], (tutorial_gui_position.x-tutorial_gui["1line3"].get_width()/2, tutorial_gui_position.y-tutorial_gui["1line3"].get_height()/2+75))
-
-            display.blit(tutorial_gui["2line1s"], (tutorial_gui_position.x-tutorial_gui["2line1s"].get_width()/2+3+600, tutorial_gui_position.y-tutorial_gui["2line1s"].get_height()/2-60+3))
-            display.blit(tutorial_gui["2line1"], (tutorial_gui_position.x-tutorial_gui["2line1"].get_width()/2+600, tutorial_gui_position.y-tutorial_gui["2line1"].get_height()/2-60))
-            display.blit(tutorial_gui["2line2s"], (tutorial_gui_position.x-tutorial_gui["2line2s"].get_width()/2+3+600, tutorial_gui_position.y-tutorial_gui["2line2s"].get_height()/2-40+3))
-            display.blit(tutorial_gui["2line2"], (tutorial_gui_position.x-tutorial_gui["2line2"].get_width()/2+600, tutorial_gui_position.y-tutorial_gui["2line2"].get_height()/2-40))
-            display.blit(tutorial_gui["2line3s"], (tutorial_gui_position.x-tutorial_gui["2line3s"].get_width()/2+3+600, tutorial_gui_position.y-tutorial_gui["2line3s"].get_height()/2+75+3))
-            display.blit(tutorial_gui["2line3"], (tutorial_gui_position.x-tutorial_gui["2line3"].get_width()/2+600, tutorial_gui_position.y-tutorial_gui["2line3"].get_height()/2+75))
-
-            tutorial_blob.position = pygame.Vector2((tutorial_gui_position.x+600, tutorial_gui_position.y))
-            tutorial_blob.update(dt, [], False)
-            tutorial_blob.draw(display, dt)
-
-            display.blit(mouse_sprs[mouse_sprs_index], tutorial_mouse_position)
-
-            if time.perf_counter() - tutorial_mouse_pressed_timer > 3:
-                mouse_sprs_index += 1
-                tutorial_mouse_position_index += 1
-                if mouse_sprs_index > 1:
-                    mouse_sprs_index = 0
-                if tutorial_mouse_position_index > 3:
-                    tutorial_mouse_position_index = 0
-                tutorial_mouse_pressed_timer = time.perf_counter()
-
-            if keys[K_RETURN] and not enter_pressed:
-                enter_pressed = True
-                tutorial_gui_dest_position = pygame.Vector2(float(tutorial_gui_position.x)-600.0, tutorial_gui_position.y)
-            elif not keys[K_RETURN] and enter_pressed:
-                enter_pressed = False
-
-            if tutorial_gui_position.x < -800:
-                tutorial = False
-
-        # drawing and updating the Game Over GUI
-        if game_over:
-            game_over_gui_position.x += (game_over_gui_dest_position.x - game_over_gui_position.x) / 20*dt
-            game_over_gui_position.y += (game_over_gui_dest_position.y - game_over_gui_position.y) / 20*dt
-
-            game_over_gui = {
-                "outer_window": pygame.Rect(game_over_gui_position.x - 420 / 2, game_over_gui_position.y - 420 / 2, 420,
-                                            420),
-                "inner_window": pygame.Rect(game_over_gui_position.x - 360 / 2, game_over_gui_position.y - 360 / 2, 360,
-                                            360),
-                "Title_text": main_font.render("GAME OVER :(", True, (255, 255, 0)),
-                "Title_text_shadow": main_font.render("GAME OVER :(", True, (0, 0, 0)),
-                "score_text": secondary_font.render(f"score: {points}", True, (255, 255, 0)),
-                "score_text_shadow": secondary_font.render(f"score: {points}", True, (0, 0, 0)),
-
-                "reset_button_rect": pygame.Rect(game_over_gui_position.x-80/2, game_over_gui_position.y-50/2+30, 80, 50),
-                "reset_button_text": secondary_font.render("RESET", True, (255, 255, 255)),
-                "reset_button_color": (255, 255, 0),
-                "quit_button_rect": pygame.Rect(game_over_gui_position.x-80/2, game_over_gui_position.y-50/2+90, 80, 50),
-                "quit_button_text": secondary_font.render("QUIT", True, (255, 255, 255)),
-                "quit_button_color": (255, 0, 0)
-            }
-
-            pygame.draw.rect(display, (0, 0, 0), (game_over_gui.get("outer_window").x+3, game_over_gui.get("outer_window").y+3, game_over_gui.get("outer_window").w, game_over_gui.get("outer_window").h))
-            pygame.draw.rect(display, (100, 150, 0), game_over_gui.get("outer_window"))
-            pygame.draw.rect(display, (0, 0, 0), (game_over_gui.get("inner_window").x+3, game_over_gui.get("inner_window").y+3, game_over_gui.get("inner_window").w, game_over_gui.get("inner_window").h))
-            pygame.draw.rect(display, (100, 100, 100), game_over_gui.get("inner_window"))
-
-            # button logic
-            if game_over_gui["reset_button_rect"].collidepoint(mouse_position):
-                game_over_gui["reset_button_color"] = (200, 200, 0)
-                if mouse_press[0]:
-                    button_press_sound.play()
-                    feeder = Feeder(DS)
-                    blobs = []
-                    points = 0
-                    game_over = False
-                    pygame.mixer.music.play(-1)
-                    game_over_gui_position = pygame.Vector2(DS[0]/2, DS[1]/2-600)
-            else:
-                game_over_gui["reset_button_color"] = (255, 255, 0)
-
-            if game_over_gui["quit_button_rect"].collidepoint(mouse_position):
-                game_over_gui["quit_button_color"] = (200, 0, 0)
-                if mouse_press[0]:
-                    button_press_sound.play()
-                    done = True
-            else:
-                game_over_gui["quit_button_color"] = (255, 0, 0)
-
-            # buttons
-            pygame.draw.rect(display, (0, 0, 0), (game_over_gui["reset_button_rect"].x+3, game_over_gui["reset_button_rect"].y+3, game_over_gui["reset_button_rect"].w, game_over_gui["reset_button_rect"].h))
-            pygame.draw.rect(display, game_over_gui["reset_button_color"], game_over_gui["reset_button_rect"])
 
-            pygame.draw.rect(display, (0, 0, 0), (game_over_gui["quit_button_rect"].x+3, game_over_gui["quit_button_rect"].y+3, game_over_gui["quit_button_rect"].w, game_over_gui["quit_button_rect"].h))
-            pygame.draw.rect(display, game_over_gui["quit_button_color"], game_over_gui["quit_button_rect"])
-
-            # button text
-            display.blit(
-                game_over_gui["reset_button_text"],
-                (game_over_gui_position.x - game_over_gui["reset_button_text"].get_width() / 2, game_over_gui_position.y-game_over_gui["reset_button_text"].get_height()/2+34)
-            )
-
-            display.blit(
-                game_over_gui["quit_button_text"],
-                (game_over_gui_position.x - game_over_gui["quit_button_text"].get_width() / 2, game_over_gui_position.y-game_over_gui["quit_button_text"].get_height()/2+94)
-            )
-
-            # text
-            display.blit(game_over_gui.get("Title_text_shadow"), (game_over_gui_position.x-game_over_gui.get("Title_text").get_width()/2+3, game_over_gui_position.y-160+3))
-            display.blit(game_over_gui.get("Title_text"), (game_over_gui_position.x-game_over_gui.get("Title_text").get_width()/2, game_over_gui_position.y-160))
-
-            game_over_gui["score_text"] = secondary_font.render(f"score: {points}", True, (255, 255, 0))
-            game_over_gui["score_text_shadow"] = secondary_font.render(f"score: {points}", True, (0, 0, 0))
-            display.blit(game_over_gui.get("score_text_shadow"), (game_over_gui_position.x-game_over_gui.get("score_text").get_width()/2+3, game_over_gui_position.y-100+3))
-            display.blit(game_over_gui.get("score_text"), (game_over_gui_position.x-game_over_gui.get("score_text").get_width()/2, game_over_gui_position.y-100))
-
-        pygame.display.update()
+                if menu_quit_button.update(mouse_position):
+                    if mouse_press[0] and game_started_gui_dest_position == game_started_gui_position:
+                        button_press_sound.play()
+                        done = True
+
+                game_started_gui.draw(display)
+                if dirty_rects:
+                    renderer.mark(game_started_gui.dirty_rect())
+
+                if game_started_gui_position.y < -100:
+                    game_started = True
+                    tutorial = True
+
+            # drawing the Tutorial GUI
+            if tutorial:
+                tutorial_gui_position.x += (tutorial_gui_dest_position.x - tutorial_gui_position.x) / 20*dt
+                tutorial_gui_position.y += (tutorial_gui_dest_position.y - tutorial_gui_position.y) / 20*dt
+                tutorial_mouse_position.x += (tutorial_gui_dest_position.x - tutorial_gui_position.x) / 20*dt
+                tutorial_mouse_position.y += (tutorial_gui_dest_position.y - tutorial_gui_position.y) / 20*dt
+
+                tutorial_mouse_dest_positions = [pygame.Vector2(tutorial_gui_position.x - 120, tutorial_gui_position.y - 10), pygame.Vector2(0, 0),
+                                                 pygame.Vector2(tutorial_gui_position.x + 60, tutorial_gui_position.y - 10), pygame.Vector2(0, 0)]
+                tutorial_mouse_dest_position = tutorial_mouse_dest_positions[tutorial_mouse_position_index]
+
+                if not mouse_sprs_index:
+                    tutorial_mouse_position.x += (tutorial_mouse_dest_position.x - tutorial_mouse_position.x) / 20*dt
+                    tutorial_mouse_position.y += (tutorial_mouse_dest_position.y - tutorial_mouse_position.y) / 20*dt
+
+                tutorial_gui.position = pygame.Vector2(tutorial_gui_position)
+                tutorial_gui.draw(display)
+                if dirty_rects:
+                    renderer.mark(tutorial_gui.dirty_rect())
+
+                tutorial_blob.position = pygame.Vector2((tutorial_gui_position.x+600, tutorial_gui_position.y))
+                tutorial_blob.update(dt, None, False)
+                tutorial_blob.draw(display)
+                if dirty_rects:
+                    for rect in tutorial_blob.bounding_rects():
+                        renderer.mark(rect)
+
+                mouse_rect = display.blit(mouse_sprs[mouse_sprs_index], tutorial_mouse_position)
+                if dirty_rects:
+                    renderer.mark(mouse_rect)
+
+                if game_clock.now() - tutorial_mouse_pressed_timer > 3:
+                    mouse_sprs_index += 1
+                    tutorial_mouse_position_index += 1
+                    if mouse_sprs_index > 1:
+                        mouse_sprs_index = 0
+                    if tutorial_mouse_position_index > 3:
+                        tutorial_mouse_position_index = 0
+                    tutorial_mouse_pressed_timer = game_clock.now()
+
+                if keys[K_RETURN] and not enter_pressed:
+                    enter_pressed = True
+                    tutorial_gui_dest_position = pygame.Vector2(float(tutorial_gui_position.x)-600.0, tutorial_gui_position.y)
+                elif not keys[K_RETURN] and enter_pressed:
+                    enter_pressed = False
+
+                if tutorial_gui_position.x < -800:
+                    tutorial = False
+
+            # drawing and updating the Game Over GUI
+            if simulation.game_over:
+                game_over_gui_position.x += (game_over_gui_dest_position.x - game_over_gui_position.x) / 20*dt
+                game_over_gui_position.y += (game_over_gui_dest_position.y - game_over_gui_position.y) / 20*dt
+
+                game_over_gui.position = pygame.Vector2(game_over_gui_position)
+                score_label.set_text(f"score: {simulation.points}")
+
+                # button logic
+                if reset_button.update(mouse_position):
+                    if mouse_press[0]:
+                        button_press_sound.play()
+                        simulation.reset()
+                        recorder.reset()
+                        pygame.mixer.music.play(-1)
+                        game_over_gui_position = pygame.Vector2(DS[0]/2, DS[1]/2-600)
+                        renderer.mark_all()  # the game over screen disappears without moving away
+
+                if game_over_quit_button.update(mouse_position):
+                    if mouse_press[0]:
+                        button_press_sound.play()
+                        done = True
+
+                game_over_gui.draw(display)
+                if dirty_rects:
+                    renderer.mark(game_over_gui.dirty_rect())
+
+        if profiler.enabled:
+            profiler.count("blobs", len(simulation.blobs))
+            profiler.count("particles", simulation.particle_count() + len(background_particles))
+            overlay_rect = profiler.draw(display, profiler_font)
+            if dirty_rects:
+                renderer.mark(overlay_rect)
+
+        if not dirty_rects:
+            with profiler.timer("present"):
+                pygame.display.update()
 
         # event loop
         for event in pygame.event.get():
@@ -410,7 +339,10 @@ def main() -> None:
                 done = True
             if event.type == VIDEORESIZE:
                 # resets the background
-                background_points = [[i] for i in range(-200, DS[1] + 100, 100)]
+                background.build(DS)
+                backdrop = build_backdrop()
+                renderer.mark_all()
+                presenter.resize()
                 current_ws = event.w, event.h
 
                 # if  window is smaller than Original window size then scale the ZOOM so the mouse position fits
@@ -444,11 +376,11 @@ def main() -> None:
                         WS = event.w, event.w
                         ZOOM = [ORIGIN_WS[0] / WS[0], ORIGIN_WS[1] / WS[1]]
 
-                for b in blobs:
-                    b.position.y = b.dest
+                simulation.settle()
 
-        pygame.display.set_caption(f"feed the bunny FPS: {round(clock.get_fps(), 2)}")
-        pygame.display.set_icon(icon_sprite)
+        if time.perf_counter() - caption_timer > 0.5:
+            pygame.display.set_caption(f"feed the bunny FPS: {round(clock.get_fps(), 2)}")
+            caption_timer = time.perf_counter()
 
         """
             this makes sure that if the window is bigger
@@ -464,10 +396,25 @@ def main() -> None:
         else:
             display_offset[1] = 0
 
-        surf = pygame.transform.scale(display, WS)
-        window.blit(surf, display_offset)
-        clock.tick(60)
-
+        # scaling the display to the window and updating the screen are timed apart
+        with profiler.timer("scale"):
+            if dirty_rects:
+                window_rects = renderer.present(window, display, WS, display_offset)
+            else:
+                presenter.present(window, display, WS, display_offset)
+        if dirty_rects:
+            with profiler.timer("present"):
+                if window_rects is None:
+                    pygame.display.update()
+                else:
+                    pygame.display.update(window_rects)
+        with profiler.timer("wait"):
+            clock.tick(60)
+        profiler.end_frame()
+
+    if profiler.enabled:
+        profiler.dump(profile_output)
+    recorder.close()
     pygame.quit()
 
 
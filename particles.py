@@ -0,0 +1,288 @@
+import pygame
+import numpy as np
+
+import math
+
+import sprites
+
+# when this is on every draw adds the rect it drew into to drawn_rect, only the dirty rect renderer needs it
+track_drawn = False
+
+
+def points_in_rect(points: np.ndarray, rect: pygame.Rect) -> np.ndarray:
+    """
+    the same test as Rect.collidepoint but for a whole (n, 2) array of points,
+    it returns a boolean mask that is True for the points inside the rect,
+    the points are truncated to whole pixels the way pygame does it
+    """
+    x = np.trunc(points[:, 0])
+    y = np.trunc(points[:, 1])
+    return (x >= rect.left) & (x < rect.right) & (y >= rect.top) & (y < rect.bottom)
+
+
+class SpatialHash:
+    """
+    uniform grid over a set of points, the points are sorted by the cell they are in
+    so every column of cells inside a rect is one contiguous slice of the sorted points,
+    build it once per frame and then query it with as many rects as needed
+    """
+    _ROW_OFFSET = 1 << 20  # keeps negative cell rows positive inside the packed key
+
+    def __init__(self, cell_size: int = 32):
+        self.cell_size = cell_size
+        self.points = np.zeros((0, 2))
+        self._order = np.zeros(0, dtype=np.int64)
+        self._keys = np.zeros(0, dtype=np.int64)
+
+    def _key(self, column, row):
+        return column * (self._ROW_OFFSET * 2) + (row + self._ROW_OFFSET)
+
+    def build(self, points: np.ndarray) -> None:
+        self.points = points
+        cells = np.trunc(points).astype(np.int64) // self.cell_size
+        keys = self._key(cells[:, 0], cells[:, 1])
+        self._order = np.argsort(keys, kind="stable")
+        self._keys = keys[self._order]
+
+    def query(self, rect: pygame.Rect) -> np.ndarray:
+        """
+        returns the indexes of the points inside rect, the same points Rect.collidepoint would accept
+        """
+        if not len(self._keys) or rect.w <= 0 or rect.h <= 0:
+            return np.zeros(0, dtype=np.int64)
+
+        first_row, last_row = rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size
+        slices = []
+        for column in range(rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1):
+            start = np.searchsorted(self._keys, self._key(column, first_row), "left")
+            end = np.searchsorted(self._keys, self._key(column, last_row), "right")
+            if start < end:
+                slices.append(self._order[start:end])
+
+        if not slices:
+            return np.zeros(0, dtype=np.int64)
+
+        candidates = np.concatenate(slices)
+        return candidates[points_in_rect(self.points[candidates], rect)]
+
+    def count(self, rect: pygame.Rect) -> int:
+        return len(self.query(rect))
+
+
+class ParticleSystem:
+    """
+    drop in replacement for xfps.ShapeParticles that keeps the particles in
+    contiguous numpy arrays (one array per property) instead of one dict per particle,
+    so moving, shrinking and removing dead particles is done on the whole batch at once
+    """
+    def __init__(self, shape_type: str, gravity: float = 0.0, capacity: int = 64, render_mode: str = "draw"):
+        if shape_type not in ("circle", "rectangle"):
+            raise TypeError(f"{shape_type} is an invalid shape type you can use circle or rectangle")
+        if render_mode not in ("blits", "draw"):
+            raise TypeError(f"{render_mode} is an invalid render mode you can use blits or draw")
+
+        self.shape_type = shape_type
+        self.gravity = gravity
+        # draw calls pygame.draw for every particle, blits draws pre-rendered sprites with one Surface.blits call,
+        # blits only pays off when a lot of particles share a size and a color, the particles of the game mostly do not
+        self.render_mode = render_mode
+        self.count = 0
+
+        self._loc = np.zeros((capacity, 2))
+        self._vel = np.zeros((capacity, 2))
+        self._size = np.zeros(capacity)
+        self._color = np.zeros((capacity, 3), dtype=np.uint8)
+        self._dis_amount = np.zeros(capacity)
+
+        self.drawn_rect = None
+
+    # views of the live part of the buffers, writing into them changes the particles
+    @property
+    def loc(self) -> np.ndarray:
+        return self._loc[:self.count]
+
+    @property
+    def vel(self) -> np.ndarray:
+        return self._vel[:self.count]
+
+    @property
+    def size(self) -> np.ndarray:
+        return self._size[:self.count]
+
+    @property
+    def color(self) -> np.ndarray:
+        return self._color[:self.count]
+
+    @property
+    def dis_amount(self) -> np.ndarray:
+        return self._dis_amount[:self.count]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _reserve(self, amount: int) -> None:
+        # grows the buffers by doubling them so adding particles stays amortized O(1)
+        needed = self.count + amount
+        capacity = len(self._size)
+        if needed <= capacity:
+            return
+
+        capacity = max(capacity * 2, needed)  # a capacity of 0 would never grow by doubling
+
+        for name in ("_loc", "_vel", "_size", "_color", "_dis_amount"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, loc: list | pygame.Vector2, angle: float, speed: float, size: float, color: tuple | pygame.Color,
+            dis_amount: float) -> None:
+        self._reserve(1)
+        i = self.count
+        self._loc[i] = loc[0], loc[1]
+        self._vel[i] = math.cos(math.radians(angle)) * speed, math.sin(math.radians(angle)) * speed
+        self._size[i] = size
+        self._color[i] = color[0], color[1], color[2]
+        self._dis_amount[i] = dis_amount
+        self.count += 1
+
+    def add_many(self, loc, angles, speeds, sizes, colors, dis_amounts) -> None:
+        """
+        adds a whole burst of particles at once, loc and colors can be one value
+        for every particle or one value per particle
+        """
+        angles = np.radians(np.asarray(angles, dtype=float))
+        amount = len(angles)
+        self._reserve(amount)
+
+        start, end = self.count, self.count + amount
+        speeds = np.asarray(speeds, dtype=float)
+        self._loc[start:end] = np.asarray(loc, dtype=float)
+        self._vel[start:end, 0] = np.cos(angles) * speeds
+        self._vel[start:end, 1] = np.sin(angles) * speeds
+        self._size[start:end] = sizes
+        self._color[start:end] = np.asarray(colors)
+        self._dis_amount[start:end] = dis_amounts
+        self.count = end
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def update(self, dt: float = 1.0) -> None:
+        # moves, shrinks and applies gravity to every particle in the same order xfps does
+        self.loc[:] += self.vel * dt
+        self.size[:] -= self.dis_amount * dt
+        self.vel[:, 1] += self.gravity * dt
+
+    def confine(self, rect: pygame.Rect, dt: float = 1.0, reset_position: tuple | None = None) -> None:
+        """
+        keeps the particles inside rect, a particle that left it is moved back by its last step
+        and bounces off by reversing its velocity, if it is still outside after that
+        it is put at reset_position (when one is given)
+        """
+        outside = ~points_in_rect(self.loc, rect)
+        if not outside.any():
+            return
+
+        self.loc[outside] -= self.vel[outside] * dt
+        self.vel[outside] *= -1
+
+        if reset_position is not None:
+            outside = ~points_in_rect(self.loc, rect)
+            self.loc[outside] = reset_position[0], reset_position[1]
+
+    def remove_dead(self) -> None:
+        """
+        compacts the buffers so only the particles with a size above zero are kept,
+        the boolean mask keeps the order of the particles, so the draw order does not change
+        """
+        alive = self.size > 0
+        if alive.all():
+            return
+
+        amount = int(np.count_nonzero(alive))
+        for name in ("_loc", "_vel", "_size", "_color", "_dis_amount"):
+            array = getattr(self, name)
+            array[:amount] = array[:self.count][alive]
+        self.count = amount
+
+    def draw(self, surf: pygame.Surface, color=None, offset: tuple = (0, 0), shadow: tuple | None = None) -> None:
+        """
+        draws the particles, color overrides the color of every particle
+        and shadow is the offset of a black copy drawn under every particle
+        """
+        if track_drawn:
+            rect = self.bounding_rect(offset, shadow)
+            if rect is not None:
+                self.drawn_rect = rect if self.drawn_rect is None else self.drawn_rect.union(rect)
+
+        if self.render_mode == "blits":
+            # pre-rendered sprites drawn with one blits call, a particle and its shadow are one sprite
+            # (a shadow pointing up or left does not fit in the sprite and is drawn as a pass of its own),
+            # newest particles are drawn first, the same order xfps draws them in
+            loc, sizes = self.loc[::-1] + offset, self.size[::-1]
+            colors = self.color[::-1] if color is None else np.broadcast_to(np.asarray(color[:3], dtype=np.uint8), (self.count, 3))
+            if shadow is not None and min(shadow) < 0:
+                sprites.blit_shapes(surf, self.shape_type, loc + shadow, sizes, np.zeros((self.count, 3), dtype=np.uint8))
+                shadow = None
+            sprites.blit_shapes(surf, self.shape_type, loc, sizes, colors, tuple(shadow or (0, 0)))
+            return
+
+        ox, oy = offset
+        colors = [tuple(c) for c in self.color[::-1].tolist()] if color is None else [tuple(color)] * self.count
+        particles = zip(self.loc[::-1].tolist(), self.size[::-1].tolist(), colors)
+
+        if self.shape_type == "circle":
+            for (x, y), size, c in particles:
+                if shadow is not None:
+                    pygame.draw.circle(surf, (0, 0, 0), (x + ox + shadow[0], y + oy + shadow[1]), size)
+                pygame.draw.circle(surf, c, (x + ox, y + oy), size)
+
+        elif self.shape_type == "rectangle":
+            for (x, y), size, c in particles:
+                if shadow is not None:
+                    pygame.draw.rect(surf, (0, 0, 0), (x + ox + shadow[0] - size / 2, y + oy + shadow[1] - size / 2, size, size))
+                pygame.draw.rect(surf, c, (x + ox - size / 2, y + oy - size / 2, size, size))
+
+    def bounding_rect(self, offset: tuple = (0, 0), shadow: tuple | None = None) -> pygame.Rect | None:
+        # the smallest rect that holds every particle (and its shadow), None when there are no particles
+        if not self.count:
+            return None
+        size = np.maximum(self.size, 0)[:, None]
+        left, top = np.floor((self.loc - size).min(axis=0)) + offset
+        right, bottom = np.ceil((self.loc + size).max(axis=0)) + offset + 1
+        rect = pygame.Rect(int(left), int(top), int(right - left), int(bottom - top))
+        return rect if shadow is None else rect.union(rect.move(shadow))
+
+    def take_drawn_rect(self) -> pygame.Rect | None:
+        # returns the part of the surface the particles were drawn into since the last call
+        rect, self.drawn_rect = self.drawn_rect, None
+        return rect
+
+    def step(self, dt: float = 1.0, operation=None, bounds: pygame.Rect | None = None,
+             reset_position: tuple | None = None) -> None:
+        """
+        the simulation half of use, it moves the particles, keeps them inside bounds, runs operation
+        and removes the dead ones without drawing anything, draw is then free to be called any number of times
+        """
+        self.update(dt)
+        if bounds is not None:
+            self.confine(bounds, dt, reset_position)
+        if operation is not None:
+            operation(self, dt)
+        self.remove_dead()
+
+    def use(self, surf: pygame.Surface, dt: float = 1.0, operation=None, shadow: tuple | None = None,
+            bounds: pygame.Rect | None = None, reset_position: tuple | None = None, offset: tuple = (0, 0)) -> None:
+        """
+        the same as ShapeParticles.use, except operation is called once with the whole
+        particle system instead of once for every particle,
+        if bounds is given the particles are kept inside it with confine before operation runs
+        """
+        self.update(dt)
+        if bounds is not None:
+            self.confine(bounds, dt, reset_position)
+        if operation is not None:
+            operation(self, dt)
+        self.draw(surf, offset=offset, shadow=shadow)
+        self.remove_dead()
@@ -0,0 +1,111 @@
+"""
+opt-in frame profiler, the stages of a frame are timed with `with profiler.timer("stage"):`,
+counters are set with profiler.count, and every frame ends with profiler.end_frame,
+a disabled profiler does nothing so the timers can stay in the game loop
+"""
+import pygame
+import numpy as np
+
+from collections import deque
+from contextlib import contextmanager, nullcontext
+import csv
+import json
+import time
+
+_NULL_TIMER = nullcontext()
+
+
+class Profiler:
+    def __init__(self, enabled: bool = True, window: int = 300):
+        self.enabled = enabled
+        self.window = window  # the overlay percentiles are over this many of the last frames
+
+        self.frames = []  # one dict of stage milliseconds and counters per frame
+        self.counters = set()
+        self._names = {}  # every stage and counter in the order they first showed up
+        self.current = {}
+        self.recent = deque(maxlen=window)
+        self.frame_start = time.perf_counter()
+
+        self.overlay_lines = []
+        self.overlay_every = 15  # the overlay text is rendered again every this many frames
+
+    def timer(self, name: str):
+        # times the block inside the with statement and adds it to the stage name of this frame
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timer(name)
+
+    @contextmanager
+    def _timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.current[name] = self.current.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def count(self, name: str, value: int) -> None:
+        if self.enabled:
+            self.current[name] = value
+            self.counters.add(name)
+
+    def end_frame(self) -> None:
+        # closes the frame, the time since the last end_frame is its total frame time
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current["total"] = (now - self.frame_start) * 1000
+        self.frame_start = now
+
+        self.frames.append(self.current)
+        self.recent.append(self.current)
+        self._names.update(dict.fromkeys(self.current))
+        self.current = {}
+
+    def percentiles(self, name: str, percents: tuple = (50, 95, 99)) -> list:
+        values = [frame.get(name, 0.0) for frame in self.recent]
+        return list(np.percentile(values, percents)) if values else [0.0] * len(percents)
+
+    def names(self) -> list:
+        return list(self._names)
+
+    def draw(self, surf: pygame.Surface, font: pygame.font.Font, position: tuple = (5, 5)) -> pygame.Rect | None:
+        """
+        draws the p50/p95/p99 of every stage over the recent frames in the corner of surf,
+        returns the rect it drew into
+        """
+        if not self.enabled or not self.recent:
+            return None
+
+        if len(self.frames) % self.overlay_every == 1 or not self.overlay_lines:
+            lines = ["stage  p50 / p95 / p99 ms"]
+            for name in self.names():
+                if name in self.counters:
+                    lines.append(f"{name}  {self.recent[-1].get(name, 0)}")
+                else:
+                    p50, p95, p99 = self.percentiles(name)
+                    lines.append(f"{name}  {p50:.2f} / {p95:.2f} / {p99:.2f}")
+            self.overlay_lines = [font.render(line, True, (255, 255, 255), (0, 0, 0)) for line in lines]
+
+        rects = []
+        x, y = position
+        for line in self.overlay_lines:
+            rects.append(surf.blit(line, (x, y)))
+            y += line.get_height()
+        return rects[0].unionall(rects[1:])
+
+    def dump(self, path: str) -> None:
+        # writes every frame to a csv file, or to a json file with a summary when path ends with .json
+        names = self.names()
+        if path.endswith(".json"):
+            summary = {name: dict(zip(("p50", "p95", "p99"), np.percentile([f.get(name, 0.0) for f in self.frames], (50, 95, 99)).tolist()))
+                       for name in names} if self.frames else {}
+            with open(path, "w") as file:
+                json.dump({"summary": summary, "frames": self.frames}, file, indent=1)
+            return
+
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame"] + names)
+            for i, frame in enumerate(self.frames):
+                writer.writerow([i] + [round(frame.get(name, 0.0), 4) for name in names])
@@ -0,0 +1,114 @@
+import pygame
+
+import math
+
+
+def merge_rects(rects: list) -> list:
+    # joins rects that overlap into one, so the same pixels are not scaled and pushed twice
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class Presenter:
+    """
+    scales the display into the window without making a new surface every frame,
+    when the scaled display fits inside the window it is scaled straight into a subsurface
+    of the window, otherwise into a buffer that is kept until the window changes
+    """
+    def __init__(self):
+        self.key = None
+        self.target = None
+        self.buffer = None
+
+    def resize(self) -> None:
+        # call on VIDEORESIZE, a subsurface of the old window must not be used after the window changed
+        self.key = None
+        self.target = None
+        self.buffer = None
+
+    def _allocate(self, window: pygame.Surface, ws: tuple, offset) -> None:
+        rect = pygame.Rect(int(offset[0]), int(offset[1]), ws[0], ws[1])
+        if window.get_rect().contains(rect):
+            self.target = window.subsurface(rect)
+            self.buffer = None
+        else:
+            self.buffer = pygame.Surface(ws, 0, window)
+            self.target = self.buffer
+
+    def present(self, window: pygame.Surface, display: pygame.Surface, ws: tuple, offset) -> None:
+        key = (window.get_size(), tuple(ws), int(offset[0]), int(offset[1]))
+        if key != self.key:
+            self._allocate(window, ws, offset)
+            self.key = key
+
+        pygame.transform.scale(display, ws, self.target)
+        if self.buffer is not None:
+            window.blit(self.buffer, offset)
+
+
+class DirtyRectRenderer:
+    """
+    optional renderer that only presents the parts of the display that changed,
+    every frame the entities report the rects they drew into with mark, the area they
+    covered in the last frame is cleaned with the backdrop and presented as well,
+    so their old position disappears from the window
+    """
+    def __init__(self, ds: tuple):
+        self.ds = ds
+        self.bounds = pygame.Rect(0, 0, ds[0], ds[1])
+        self.rects = []
+        self.last_rects = []
+        self.full_frames = 1  # how many of the next frames are cleaned and presented whole
+
+    def mark(self, rect) -> None:
+        if rect is None:
+            return
+        rect = self.bounds.clip(rect)
+        if rect.w > 0 and rect.h > 0:
+            self.rects.append(rect)
+
+    def mark_all(self) -> None:
+        """
+        cleans and presents the whole display in this and the next frame,
+        used when something that was not marked disappears (a gui screen) or the window changes
+        """
+        self.full_frames = 2
+
+    def restore(self, display: pygame.Surface, backdrop: pygame.Surface) -> None:
+        # cleans what was drawn in the last frame by copying the backdrop over it
+        if self.full_frames:
+            display.blit(backdrop, (0, 0))
+            return
+        for rect in self.last_rects:
+            display.blit(backdrop, rect, rect)
+
+    def present(self, window: pygame.Surface, display: pygame.Surface, ws: tuple, offset) -> list | None:
+        """
+        scales the dirty parts of the display to the window size, returns the rects of the window
+        to update on the screen or None when the whole window has to be updated
+        """
+        window_rects = None
+        if self.full_frames:
+            window.blit(pygame.transform.scale(display, ws), offset)
+            self.full_frames -= 1
+        else:
+            scale_x, scale_y = ws[0] / self.ds[0], ws[1] / self.ds[1]
+            window_rects = []
+            for rect in merge_rects(self.rects + self.last_rects):
+                # the edges are rounded outwards so neighbouring rects don't leave gaps between them
+                left, top = math.floor(rect.left * scale_x), math.floor(rect.top * scale_y)
+                right, bottom = math.ceil(rect.right * scale_x), math.ceil(rect.bottom * scale_y)
+                window_rect = pygame.Rect(left + offset[0], top + offset[1], right - left, bottom - top)
+                window.blit(pygame.transform.scale(display.subsurface(rect), window_rect.size), window_rect)
+                window_rects.append(window_rect)
+
+        self.last_rects = self.rects
+        self.rects = []
+        return window_rects
@@ -0,0 +1,161 @@
+"""
+records the input of every tick of a game into a small binary log and plays it back
+through the simulation as fast as it can, with the same seed and the same input the
+game plays out the same way, so a session can be replayed to find the frame time spikes
+in it or to compare two versions of the game, record with main.py --record=session.ftb and replay with:
+    python replay.py session.ftb
+    python replay.py session.ftb --profile-output=ticks.csv
+
+the log is a header of (magic, version, seed, display width, display height)
+followed by one (dt, flags, mouse x, mouse y) record per tick, the flags are the
+three mouse buttons, if the blobs were spawning, if the game was reset before the tick
+and if the blobs were settled on the ground in the tick (the window was resized),
+dt and the mouse position are doubles because main works out the mouse position in
+floats when the window is zoomed and float32 would make the replay drift from the game
+"""
+import pygame
+
+import argparse
+import os
+import struct
+import sys
+import time
+
+from simulation import Simulation
+from profiler import Profiler
+from rng import RandomStreams
+
+MAGIC = b"FTBR"
+VERSION = 3
+HEADER = struct.Struct("<4sHqHH")  # the seed is signed because --seed takes negative numbers too
+TICK = struct.Struct("<dBdd")
+
+SPAWNING = 1 << 3
+RESET = 1 << 4
+SETTLE = 1 << 5
+
+
+class Recorder:
+    """
+    writes the input of every tick of simulation to path, a recorder without a path does nothing
+    so main can call it every tick, call tick right before the simulation ticks and reset when the game resets
+    """
+    def __init__(self, path: str | None, simulation: Simulation):
+        self.enabled = path is not None
+        self.simulation = simulation
+        self.reset_pending = False
+        self.file = None
+        if self.enabled:
+            seed = simulation.rng.root_seed
+            if not -2**63 <= seed < 2**63:
+                raise ValueError(f"the seed {seed} does not fit in the 64 bits the input log has for it")
+            self.file = open(path, "wb")
+            self.file.write(HEADER.pack(MAGIC, VERSION, simulation.rng.root_seed, *simulation.ds))
+
+    def tick(self, dt: float, mouse_press: tuple, mouse_position) -> None:
+        if not self.enabled:
+            return
+        flags = mouse_press[0] | mouse_press[1] << 1 | mouse_press[2] << 2
+        if self.simulation.spawning:
+            flags |= SPAWNING
+        if self.reset_pending:
+            flags |= RESET
+            self.reset_pending = False
+        if self.simulation.settle_pending:
+            flags |= SETTLE
+        self.file.write(TICK.pack(dt, flags, mouse_position[0], mouse_position[1]))
+
+    def reset(self) -> None:
+        # the reset is written with the next tick, replay resets the simulation right before that tick
+        self.reset_pending = True
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def load(path: str) -> tuple:
+    """
+    reads a log, returns (seed, ds, ticks), ticks is a list of (dt, flags, mouse_press, mouse_position)
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+
+    magic, version, seed, width, height = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an input log")
+    if version != VERSION:
+        raise ValueError(f"{path} is an input log of version {version}, this version reads version {VERSION}")
+
+    # the log of a game that crashed can end in half a record, it is left out
+    end = len(data) - (len(data) - HEADER.size) % TICK.size
+    ticks = []
+    for dt, flags, x, y in TICK.iter_unpack(data[HEADER.size:end]):
+        ticks.append((dt, flags, (bool(flags & 1), bool(flags & 2), bool(flags & 4)), (x, y)))
+    return seed, (width, height), ticks
+
+
+def replay(path: str, profiler: Profiler | None = None) -> dict:
+    """
+    plays the log at path back through a new simulation as fast as possible, every tick is
+    a frame of profiler, returns the throughput and how the game ended
+    """
+    seed, ds, ticks = load(path)
+    profiler = profiler or Profiler(enabled=False)
+    simulation = Simulation(ds, profiler=profiler, rng=RandomStreams(seed))
+
+    start = profiler.frame_start = time.perf_counter()
+    for dt, flags, mouse_press, mouse_position in ticks:
+        if flags & RESET:
+            simulation.reset()
+        if flags & SETTLE:
+            simulation.settle()
+        simulation.spawning = bool(flags & SPAWNING)
+        simulation.tick(dt, mouse_press, mouse_position)
+        profiler.end_frame()
+    seconds = time.perf_counter() - start
+
+    return {
+        "seed": seed,
+        "ticks": len(ticks),
+        "seconds": seconds,
+        "ticks_per_second": len(ticks) / seconds if seconds else float("inf"),
+        "points": simulation.points,
+        "game_over": simulation.game_over,
+        "blobs": len(simulation.blobs),
+        "particles": simulation.particle_count(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("log", help="the input log written by main.py --record")
+    parser.add_argument("--profile-output", help="writes the stage times of every tick to this csv or json file")
+    args = parser.parse_args()
+
+    path = os.path.abspath(args.log)
+    profile_output = args.profile_output and os.path.abspath(args.profile_output)
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))  # the assets are loaded relative to the repo
+    # set here and not on import because main imports the recorder from this file
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+    profiler = Profiler(profile_output is not None)
+    result = replay(path, profiler)
+    for key, value in result.items():
+        print(f"{key}: {round(value, 2) if isinstance(value, float) else value}")
+
+    if profile_output:
+        profiler.dump(profile_output)
+        worst = max(range(len(profiler.frames)), key=lambda i: profiler.frames[i]["total"], default=None)
+        if worst is not None:
+            print(f"slowest tick: {worst} ({profiler.frames[worst]['total']:.2f} ms)")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
+    sys.exit()
@@ -0,0 +1,31 @@
+"""
+the random number streams of a game, every subsystem draws from its own random.Random
+so drawing more or less numbers in one of them does not change what the others draw,
+a game built with the same seed and played with the same input plays out the same way
+"""
+import os
+import random
+
+
+class RandomStreams:
+    """
+    spawner: which blob spawns, blobs: how fast and which way a blob moves and how big it starts,
+    food: the food of the feeder, explosion: the particles of an exploding blob,
+    cosmetic: particles that only look nice, blobs are reset when they go back to the pool, so how
+    the game is played changes the blobs stream but never the spawner stream
+    """
+    def __init__(self, seed: int | None = None):
+        self.seed(seed)
+
+    def seed(self, seed: int | None = None) -> None:
+        # seeds every stream from seed, a new seed is picked when it is None so it can still be read back
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), "little")
+        self.root_seed = seed
+
+        # string seeds are hashed the same way on every run and machine, unlike hash()
+        self.spawner = random.Random(f"{seed}/spawner")
+        self.blobs = random.Random(f"{seed}/blobs")
+        self.food = random.Random(f"{seed}/food")
+        self.explosion = random.Random(f"{seed}/explosion")
+        self.cosmetic = random.Random(f"{seed}/cosmetic")
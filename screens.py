@@ -0,0 +1,50 @@
+import pygame
+
+import assets
+import gui
+
+
+def tutorial_window(x: float, font: pygame.font.Font, line1: str, line2: str) -> gui.Panel:
+    return gui.Panel((x, 0), (440, 220), (100, 150, 0), children=[
+        gui.Panel((0, 0), (400, 180), (100, 100, 100)),
+        gui.Label((0, -60), font, line1, (255, 255, 0), shadow=3),
+        gui.Label((0, -40), font, line2, (255, 255, 0), shadow=3),
+        gui.Label((0, 75), font, "press Enter", (255, 255, 0), shadow=3),
+    ])
+
+
+class Screens:
+    """
+    the menu, tutorial and game over screens, they are built once
+    and moved around by the position of their root
+    """
+    def __init__(self, menu_position, tutorial_position, game_over_position):
+        main_font = assets.font("assets/font/main-font.ttf", 40)
+        secondary_font = assets.font("assets/font/main-font.ttf", 25)
+        small_font = assets.font("assets/font/main-font.ttf", 18)
+        title_font = assets.font("assets/font/title-font.ttf", 70)
+
+        self.play_button = gui.Button((0, -30), (80, 50), (0, 255, 0), (0, 200, 0), gui.Label((0, 4), secondary_font, "PLAY", (255, 255, 255)))
+        self.menu_quit_button = gui.Button((0, 50), (80, 50), (255, 0, 0), (200, 0, 0), gui.Label((0, 4), secondary_font, "QUIT", (255, 255, 255)))
+        self.menu = gui.Widget(menu_position, [
+            gui.Label((0, -180), title_font, "feed-the-blob", (0, 0, 255), shadow=3),
+            self.play_button,
+            self.menu_quit_button,
+        ])
+
+        self.tutorial = gui.Widget(tutorial_position, [
+            tutorial_window(0, small_font, "control the feeder by holding the left mouse button", "and by dragging the mouse around"),
+            tutorial_window(600, small_font, "when the blob blinks red its going to explode", "when it explodes this way its you lose the game"),
+        ])
+
+        self.reset_button = gui.Button((0, 30), (80, 50), (255, 255, 0), (200, 200, 0), gui.Label((0, 4), secondary_font, "RESET", (255, 255, 255)))
+        self.game_over_quit_button = gui.Button((0, 90), (80, 50), (255, 0, 0), (200, 0, 0), gui.Label((0, 4), secondary_font, "QUIT", (255, 255, 255)))
+        self.score_label = gui.Label((0, -100), secondary_font, "score: 0", (255, 255, 0), shadow=3, anchor="top")
+        self.game_over = gui.Widget(game_over_position, [
+            gui.Panel((0, 0), (420, 420), (100, 150, 0)),
+            gui.Panel((0, 0), (360, 360), (100, 100, 100)),
+            self.reset_button,
+            self.game_over_quit_button,
+            gui.Label((0, -160), main_font, "GAME OVER :(", (255, 255, 0), shadow=3, anchor="top"),
+            self.score_label,
+        ])
@@ -0,0 +1,91 @@
+from particles import SpatialHash
+from entities import Feeder, Blob
+from spawner import BlobSpawner
+from profiler import Profiler
+from rng import RandomStreams
+from timestep import GameClock
+
+
+class Simulation:
+    """
+    the game logic without anything that needs a window, main drives it with the real input
+    and draws it, headless.py drives it with scripted input as fast as it can,
+    two simulations with the same seed in rng and the same input play out the same way
+    """
+    def __init__(self, ds: tuple, spawner: BlobSpawner | None = None, profiler: Profiler | None = None,
+                 rng: RandomStreams | None = None, clock: GameClock | None = None):
+        self.ds = ds
+        self.profiler = profiler or Profiler(enabled=False)
+        # a spawner that is passed in should be built with the same streams and clock
+        self.rng = rng or RandomStreams()
+        self.clock = clock or GameClock()  # moves one tick every tick, every timer of the game reads it
+
+        self.feeder = Feeder(ds, self.rng)
+        self.food_grid = SpatialHash()
+        self.blobs = []
+        self.spawner = spawner or BlobSpawner(ds, prewarm=1, rng=self.rng, clock=self.clock)
+
+        self.spawning = True  # main turns it off on the menu and during the tutorial
+        self.settle_pending = False  # see settle
+        self.points = 0
+        self.game_over = False
+        self.ticks = 0
+
+    def tick(self, dt: float, mouse_press: tuple, mouse_position) -> None:
+        # advances the game by one tick
+        self.clock.advance(dt)
+
+        if self.settle_pending:
+            for b in self.blobs:
+                b.position.y = b.dest
+            self.settle_pending = False
+
+        with self.profiler.timer("spawn"):
+            if not self.game_over and self.spawning:
+                self.blobs.extend(self.spawner.update(dt))
+
+        with self.profiler.timer("feeder update"):
+            self.feeder.update(dt, mouse_press, mouse_position)
+
+        with self.profiler.timer("blob update"):
+            self.food_grid.build(self.feeder.particles.loc)  # every blob checks its mouth against this grid instead of every food particle
+            for b in list(self.blobs):
+                b.update(dt, self.food_grid, self.game_over)
+                if b.not_feed:
+                    for x in self.blobs:
+                        x.radius = x.max_radius
+                    self.game_over = True
+
+                if not self.game_over and not b.alive:
+                    self.points += b.points
+                    b.points = 0
+
+                if not b.alive and len(b.particles) == 0:
+                    self.remove(b)
+
+        self.ticks += 1
+
+    def settle(self) -> None:
+        """
+        puts every blob on the ground at the start of the next tick, main does it when the window is resized,
+        it happens in a tick so the recorder can write it down and a replay does it at the same time
+        """
+        self.settle_pending = True
+
+    def remove(self, blob: Blob) -> None:
+        self.blobs.remove(blob)
+        self.spawner.recycle(blob)
+
+    def reset(self) -> None:
+        # starts a new game, the blobs go back to the spawner so the next game reuses them
+        self.feeder.reset(self.ds)
+        for b in self.blobs:
+            self.spawner.recycle(b)
+        self.blobs = []
+        self.spawner.reset()
+        self.points = 0
+        self.game_over = False
+
+    def particle_count(self) -> int:
+        return len(self.feeder.particles) + len(self.feeder.inner_particles) + sum(
+            len(b.particles) + len(b.inner_particles) + len(b.outer_particles) for b in self.blobs)
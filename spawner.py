@@ -0,0 +1,120 @@
+from entities import Blob, SpeedBlob, HeavyBlob, RandomBlob
+from rng import RandomStreams
+from timestep import GameClock
+
+import heapq
+
+
+# (factory, weight) pairs, a factory is anything that takes ds, the random streams and the game clock and returns a blob,
+# a weight is a number or a curve of the seconds of gameplay, so a blob type can get more common as the game goes on
+DEFAULT_FACTORIES = [(Blob, 4), (SpeedBlob, 8), (HeavyBlob, 2), (RandomBlob, 3)]
+
+
+def constant(interval: float):
+    # spawn curve that always waits the same amount of seconds
+    return lambda elapsed: interval
+
+
+def linear_ramp(start: float, end: float, duration: float):
+    """
+    spawn curve that goes from start seconds between spawns to end seconds
+    over duration seconds of gameplay and stays at end after that
+    """
+    def curve(elapsed):
+        return start + (end - start) * min(elapsed / duration, 1)
+    return curve
+
+
+class BlobSpawner:
+    """
+    decides when a blob spawns and which one, only the chosen blob is ever built,
+    prewarm builds blobs ahead of time (on the menu for example) and recycle puts
+    blobs that left the game back, so spawning one during the game just takes it out of the pool
+
+    the spawns are a queue of (time, blob type) events on the seconds of gameplay, the spawn curve
+    gives the time between two events, so how many blobs arrive only depends on how long the game
+    was played and not on how fast it is drawn, events are planned lookahead seconds ahead
+    """
+    def __init__(self, ds, factories: list | None = None, spawn_curve=None, prewarm: int = 0, max_pool: int = 8,
+                 rng: RandomStreams | None = None, clock: GameClock | None = None, lookahead: float = 5.0):
+        self.ds = ds
+        self.rng = rng or RandomStreams()  # the blobs it builds draw from the same streams
+        self.clock = clock or GameClock()  # and read the same clock
+
+        self.factories = factories or list(DEFAULT_FACTORIES)
+        self.spawn_curve = spawn_curve or constant(2)
+
+        self.pool = {factory: [] for factory, weight in self.factories}
+        self.max_pool = max_pool  # the most blobs of one type that are kept for reuse
+
+        self.lookahead = lookahead
+        self.reset()
+
+        self.prewarm(prewarm)
+
+    def prewarm(self, amount: int) -> None:
+        # makes sure there are at least amount ready blobs of every type
+        for factory, pool in self.pool.items():
+            while len(pool) < amount:
+                pool.append(factory(self.ds, self.rng, self.clock))
+
+    def choose(self, elapsed: float):
+        # picks the type of a blob that spawns after elapsed seconds of gameplay
+        weights = [w(elapsed) if callable(w) else w for f, w in self.factories]
+        return self.rng.spawner.choices([f for f, w in self.factories], weights=weights)[0]
+
+    def schedule(self, time: float, factory=None) -> None:
+        """
+        adds a spawn at time seconds of gameplay, the type is chosen when it is not given,
+        events can also be added from outside, a wave of blobs for example
+        """
+        if factory is None:
+            factory = self.choose(time)
+        heapq.heappush(self.events, (time, self.event_count, factory))
+        self.event_count += 1  # keeps events at the same time in the order they were added
+
+    def plan(self) -> None:
+        # adds the events of the spawn curve up to lookahead seconds from now
+        while self.next_spawn <= self.elapsed + self.lookahead:
+            self.schedule(self.next_spawn)
+            interval = self.spawn_curve(self.next_spawn)
+            if interval <= 0:
+                raise ValueError(f"the spawn curve gave {interval} seconds between spawns, it has to be more than 0")
+            self.next_spawn += interval
+
+    def create(self, factory=None) -> Blob:
+        factory = factory or self.choose(self.elapsed)
+        pool = self.pool.setdefault(factory, [])  # a scheduled event can be of a type that is not in factories
+        blob = pool.pop() if pool else factory(self.ds, self.rng, self.clock)
+        blob.spawn()
+        return blob
+
+    def recycle(self, blob: Blob) -> None:
+        """
+        gives a blob that left the game back to the pool, it is reset here
+        so taking it out of the pool again costs nothing
+        """
+        pool = self.pool.get(type(blob))
+        if pool is not None and len(pool) < self.max_pool:
+            blob.reset(self.ds)
+            pool.append(blob)
+
+    def update(self, dt: float) -> list:
+        """
+        call this every tick of gameplay, returns the blobs whose spawn time has come,
+        usually none or one
+        """
+        self.elapsed += dt / 60
+        self.plan()
+
+        blobs = []
+        while self.events and self.events[0][0] <= self.elapsed:
+            time, count, factory = heapq.heappop(self.events)
+            blobs.append(self.create(factory))
+        return blobs
+
+    def reset(self) -> None:
+        self.elapsed = 0.0  # seconds of gameplay, the spawn curve is a function of this
+        self.events = []  # heap of (time, event_count, factory)
+        self.event_count = 0
+        self.next_spawn = self.spawn_curve(0.0)  # the time of the next event the spawn curve adds
@@ -0,0 +1,155 @@
+"""
+pre-rendered circles and squares, drawing a shape with pygame.draw is rasterizing it again every time,
+here every (size, color) is rasterized once and after that it is only blitted,
+a lot of sprites can then be drawn with one Surface.blits call
+"""
+import pygame
+import numpy as np
+import xfps
+
+from collections import OrderedDict
+
+_sprites = OrderedDict()
+max_sprites = 2048  # the least recently used sprites are thrown away after this many
+
+radius_step = 1  # radii are rounded down to a multiple of this, 1 gives the same circles pygame.draw does
+color_step = 1  # the same for every channel of the color, a bigger step means fewer sprites
+
+"""
+a blit_shapes call only uses the cache when every sprite is shared by at least this many particles on average,
+particles with a random color and a shrinking size (the food and the explosions) get a new sprite nearly every
+frame, rasterizing and caching those costs more than drawing them and throws the sprites that are reused out of the cache
+"""
+min_reuse = 4
+
+
+def _colorkey(color: tuple) -> tuple:
+    # a color that is neither the circle nor its black shadow
+    return (255, 0, 255) if color != (255, 0, 255) else (0, 255, 0)
+
+
+def _quantize_size(size: float) -> int:
+    return int(size // radius_step * radius_step)
+
+
+def quantize(radius: float, color) -> tuple:
+    color = tuple(int(c) // color_step * color_step for c in color[:3])
+    return _quantize_size(radius), color
+
+
+def _cache(key: tuple, build) -> pygame.Surface:
+    surf = _sprites.get(key)
+    if surf is not None:
+        _sprites.move_to_end(key)
+        return surf
+
+    surf = _sprites[key] = build()
+    if len(_sprites) > max_sprites:
+        _sprites.popitem(last=False)
+    return surf
+
+
+def circle(radius: float, color, shadow: tuple = (0, 0)) -> pygame.Surface:
+    """
+    a circle the same as pygame.draw.circle(surf, color, (radius, radius), radius) with a black copy
+    moved by the (positive) shadow offset under it, blit it at (x - radius, y - radius) to draw a circle at (x, y)
+    """
+    radius, color = quantize(radius, color)
+    sx, sy = shadow
+
+    def build():
+        surf = pygame.Surface((radius * 2 + sx, radius * 2 + sy))
+        surf.fill(_colorkey(color))
+        if sx or sy:
+            pygame.draw.circle(surf, (0, 0, 0), (radius + sx, radius + sy), radius)
+        pygame.draw.circle(surf, color, (radius, radius), radius)
+        surf.set_colorkey(_colorkey(color), pygame.RLEACCEL)
+        return surf
+
+    return _cache(("circle", radius, color, sx, sy), build)
+
+
+def rect(size: float, color, shadow: tuple = (0, 0)) -> pygame.Surface:
+    # a size x size square with a black copy moved by the (positive) shadow offset under it
+    size, color = quantize(size, color)
+    sx, sy = shadow
+
+    def build():
+        surf = pygame.Surface((size + sx, size + sy))
+        surf.fill(_colorkey(color))
+        if sx or sy:
+            surf.fill((0, 0, 0), (sx, sy, size, size))
+        surf.fill(color, (0, 0, size, size))
+        surf.set_colorkey(_colorkey(color), pygame.RLEACCEL)
+        return surf
+
+    return _cache(("rectangle", size, color, sx, sy), build)
+
+
+def surf_circle(r: float, color) -> pygame.Surface:
+    """
+    cached xfps.surf_circle, the radius and color are quantized the same way as the sprites,
+    the surface is shared by everyone who asks for it so it must only be blitted, never drawn on
+    """
+    radius, color = quantize(r, color)
+    return _cache(("surf_circle", radius, color), lambda: xfps.surf_circle(radius, color))
+
+
+def surf_rect(w: float, h: float, color) -> pygame.Surface:
+    # cached xfps.surf_rect, shared the same way as surf_circle
+    w, color = quantize(w, color)
+    h = _quantize_size(h)
+    return _cache(("surf_rect", w, h, color), lambda: xfps.surf_rect(w, h, color))
+
+
+def blit_shapes(surf: pygame.Surface, shape_type: str, positions: np.ndarray, sizes: np.ndarray, colors: np.ndarray,
+                shadow: tuple = (0, 0)) -> None:
+    """
+    draws a circle (size is the radius) or a square centered on every position with one Surface.blits call,
+    the positions and sizes are truncated to whole pixels the same way pygame.draw does it,
+    every different (size, color) goes through the lru cache only once per call,
+    when the particles do not share enough sprites they are drawn with pygame.draw and the cache is left alone
+    """
+    visible = sizes >= 1
+    positions, sizes, colors = positions[visible], sizes[visible], colors[visible]
+    if not len(sizes):
+        return
+
+    if shape_type == "circle":
+        shape = circle
+        top_left = np.trunc(positions) - np.trunc(sizes)[:, None]
+    else:
+        shape = rect
+        top_left = np.trunc(positions - sizes[:, None] / 2)
+
+    # (size, color) packed in one integer so finding the different sprites is one sort of a flat array
+    colors = colors.astype(np.int64)
+    packed = (sizes.astype(np.int64) << 24) | (colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2]
+    keys, inverse = np.unique(packed, return_inverse=True)
+    if len(keys) > max_sprites or len(keys) * min_reuse > len(sizes):
+        # the cache can not hold them all or they are hardly reused, building them would cost more than drawing
+        _draw_shapes(surf, shape_type, positions, top_left, sizes, colors, shadow)
+        return
+
+    shapes = [shape(key >> 24, ((key >> 16) & 255, (key >> 8) & 255, key & 255), shadow) for key in keys.tolist()]
+    batch = zip([shapes[i] for i in inverse.ravel().tolist()], top_left.astype(int).tolist())
+    surf.blits(batch, doreturn=False)
+
+
+def _draw_shapes(surf: pygame.Surface, shape_type: str, positions: np.ndarray, top_left: np.ndarray, sizes: np.ndarray,
+                 colors: np.ndarray, shadow: tuple) -> None:
+    # the same pixels as blit_shapes with one pygame.draw call per shape (and one per shadow)
+    sx, sy = shadow
+    for (x, y), (left, top), size, color in zip(positions.tolist(), top_left.tolist(), sizes.tolist(), colors.tolist()):
+        if shape_type == "circle":
+            if sx or sy:
+                pygame.draw.circle(surf, (0, 0, 0), (x + sx, y + sy), size)
+            pygame.draw.circle(surf, color, (x, y), size)
+        else:
+            if sx or sy:
+                surf.fill((0, 0, 0), (left + sx, top + sy, size, size))
+            surf.fill(color, (left, top, size, size))
+
+
+def clear() -> None:
+    _sprites.clear()
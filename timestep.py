@@ -0,0 +1,62 @@
+"""
+fixed timestep, the simulation always advances in ticks of the same length no matter how long
+a frame took, the time that is left over is carried to the next frame and the renderer uses it
+to interpolate between the last two ticks
+"""
+import time
+
+
+class FixedTimestep:
+    def __init__(self, tick_rate: int = 60, max_ticks: int = 5):
+        self.tick_rate = tick_rate
+        self.tick_length = 1 / tick_rate  # in seconds
+        self.dt = 60 / tick_rate  # one tick in the units the game uses for dt, 1 is one frame at 60 fps
+        self.max_ticks = max_ticks  # after a very slow frame the game slows down instead of running a lot of ticks at once
+
+        self.accumulator = 0.0
+        self.ticks = 0  # every tick simulated so far
+        self.last_time = None
+
+    def advance(self, elapsed: float | None = None) -> int:
+        """
+        returns how many ticks the simulation has to run this frame, elapsed is the time
+        in seconds since the last frame and is read from the clock when it is not given,
+        giving it makes the simulation run faster (or slower) than real time
+        """
+        if elapsed is None:
+            now = time.perf_counter()
+            elapsed = 0.0 if self.last_time is None else now - self.last_time
+            self.last_time = now
+
+        self.accumulator += elapsed
+        ticks = int(self.accumulator / self.tick_length)
+        if ticks > self.max_ticks:
+            ticks = self.max_ticks
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.tick_length
+
+        self.ticks += ticks
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        # how far the frame is between the last tick and the next one, from 0 to 1
+        return min(self.accumulator / self.tick_length, 1.0)
+
+
+class GameClock:
+    """
+    the time of the game in seconds, it only moves when the simulation ticks so the timers
+    of the game read it instead of the real clock, a game that runs faster than real time
+    (headless, a replay) or slows down under load then behaves the same as one at 60 ticks per second
+    """
+    def __init__(self):
+        self.time = 0.0
+
+    def advance(self, dt: float) -> None:
+        # dt is in the units the game uses, 1 is one tick at 60 ticks per second
+        self.time += dt / 60
+
+    def now(self) -> float:
+        return self.time
@@ -5,16 +5,55 @@ import time
 import random as rnd
 import math
 import asyncio
+from collections import OrderedDict
 
+_surfs = OrderedDict()  # the surfaces made by surf_circle and surf_rect, least recently used first
+max_surfs = 512
+radius_step = 1  # radii and sizes are rounded down to a multiple of this, a bigger step means fewer surfaces
 
-def surf_circle(r: float, color: tuple | pygame.Color) -> pygame.Surface:
-    surf = pygame.Surface((r * 2, r * 2)) if r > 0 else pygame.Surface((0, 0))
-    pygame.draw.circle(surf, color, (r, r), r)
-    surf.set_colorkey((0, 0, 0))
 
+def _cached_surf(key: tuple, build) -> pygame.Surface:
+    surf = _surfs.get(key)
+    if surf is not None:
+        _surfs.move_to_end(key)
+        return surf
+
+    surf = _surfs[key] = build()
+    if len(_surfs) > max_surfs:
+        _surfs.popitem(last=False)
     return surf
 
 
+def surf_circle(r: float, color: tuple | pygame.Color) -> pygame.Surface:
+    """
+    the surfaces are cached by radius and color, so the same surface is shared
+    by everyone who asks for it and must only be blitted, never drawn on
+    """
+    r = int(r // radius_step * radius_step)
+    color = (int(color[0]), int(color[1]), int(color[2]))
+
+    def build():
+        surf = pygame.Surface((r * 2, r * 2)) if r > 0 else pygame.Surface((0, 0))
+        pygame.draw.circle(surf, color, (r, r), r)
+        surf.set_colorkey((0, 0, 0))
+        return surf
+
+    return _cached_surf(("circle", r, color), build)
+
+
+def surf_rect(w: float, h: float, color: tuple | pygame.Color) -> pygame.Surface:
+    # cached the same way as surf_circle
+    w, h = int(w // radius_step * radius_step), int(h // radius_step * radius_step)
+    color = (int(color[0]), int(color[1]), int(color[2]))
+
+    def build():
+        surf = pygame.Surface((w, h)) if w > 0 and h > 0 else pygame.Surface((0, 0))
+        surf.fill(color)
+        return surf
+
+    return _cached_surf(("rect", w, h, color), build)
+
+
 class ShapeParticles:
     def __init__(self, shape_type: str, gravity: float = 0.0):
         self.shape_type = shape_type
@@ -34,34 +73,39 @@ class ShapeParticles:
             }
         )
 
+    def remove_dead(self):
+        """
+        removes every particle with a size of zero or less in one pass at the end of the frame,
+        the list is changed in place so code that holds a reference to objects still sees it
+        """
+        self.objects[:] = [p for p in self.objects if p["size"] > 0]
+
     def use(self, surf: pygame.Surface, dt: float = 1.0, operation=lambda x, dt: x):
         if self.shape_type == "circle":
-            for i, p in sorted(enumerate(self.objects), reverse=True):
+            for p in reversed(self.objects):
                 p["loc"][0] += p["vel"][0] * dt
                 p["loc"][1] += p["vel"][1] * dt
                 p["size"] -= p["dis_amount"] * dt
                 p["vel"][1] += self.gravity * dt
                 operation(p, dt)
                 pygame.draw.circle(surf, p["color"], p["loc"], p["size"])
-                if p["size"] <= 0:
-                    self.objects.pop(i)
 
         elif self.shape_type == "rectangle":
-            for i, p in sorted(enumerate(self.objects), reverse=True):
+            for p in reversed(self.objects):
                 p["loc"][0] += p["vel"][0] * dt
                 p["loc"][1] += p["vel"][1] * dt
                 p["size"] -= p["dis_amount"] * dt
                 p["vel"][1] += self.gravity * dt
                 operation(p, dt)
                 pygame.draw.rect(surf, p["color"], (p["loc"][0]-p["size"]/2, p["loc"][1]-p["size"]/2, p["size"], p["size"]))
-                if p["size"] <= 0:
-                    self.objects.pop(i)
         else:
             raise TypeError(f"{self.shape_type} is an invalid shape type you can use circle or rectangle")
 
+        self.remove_dead()
+
     def use_with_light(self, surf: pygame.Surface, dt: float, operation=lambda x, dt: x):
         if self.shape_type == "circle":
-            for i, p in sorted(enumerate(self.objects), reverse=True):
+            for p in reversed(self.objects):
                 p["loc"][0] += p["vel"][0] * dt
                 p["loc"][1] += p["vel"][1] * dt
                 p["size"] -= p["dis_amount"] * dt
@@ -72,11 +116,9 @@ class ShapeParticles:
                           (p["loc"][0] - int(light_surf.get_width() / 2), p["loc"][1] - int(light_surf.get_height() / 2)),
                           special_flags=pygame.BLEND_RGB_ADD)
                 pygame.draw.circle(surf, p["color"], p["loc"], p["size"])
-                if p["size"] <= 0:
-                    self.objects.pop(i)
 
         elif self.shape_type == "rectangle":
-            for i, p in sorted(enumerate(self.objects), reverse=True):
+            for p in reversed(self.objects):
                 p["loc"][0] += p["vel"][0] * dt
                 p["loc"][1] += p["vel"][1] * dt
                 p["size"] -= p["dis_amount"] * dt
@@ -87,11 +129,11 @@ class ShapeParticles:
                           (p["loc"][0] - int(light_surf.get_width() / 4)-p["size"]/2, p["loc"][1] - int(light_surf.get_height() / 4)-p["size"]/2),
                           special_flags=pygame.BLEND_RGB_ADD)
                 pygame.draw.rect(surf, p["color"], (p["loc"][0]-p["size"]/2, p["loc"][1]-p["size"]/2, p["size"], p["size"]))
-                if p["size"] <= 0:
-                    self.objects.pop(i)
         else:
             raise TypeError(f"{self.shape_type} is an invalid shape type you can use circle or rectangle")
 
+        self.remove_dead()
+
 
 class Feeder:
     def __init__(self, ds: tuple):